@@ -0,0 +1,271 @@
+"""Benchmarks for the CatGenie parse and update pipeline.
+
+Run from the repository root in an environment with Home Assistant
+installed::
+
+    python -m benchmarks.bench
+    python -m benchmarks.bench --json results.json
+    python -m benchmarks.bench --compare results.json
+
+Every benchmark runs against the recorded fixtures for each fleet size in
+``DEVICE_COUNTS`` and reports operations per second and the peak memory
+allocated by a single operation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.catgenie.api import CatGenieApiClient
+from custom_components.catgenie.binary_sensor import (
+    CatGenieConnectivitySensor,
+    CatGenieOccupancy,
+    CatGenieProblemSensor,
+    CatGenieRunningSensor,
+)
+from custom_components.catgenie.coordinator import CatGenieCoordinator
+from custom_components.catgenie.data import DeviceData
+from custom_components.catgenie.sensor import CatGenieSaniSolutionSensor
+from custom_components.catgenie.switch import CatGenieSwitch
+
+from .fixtures import DEVICE_COUNTS, devices
+from .stub import StubSession
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_components.catgenie.entity import CatGenieEntity
+
+ENTITY_CLASSES: tuple[type[CatGenieEntity], ...] = (
+    CatGenieConnectivitySensor,
+    CatGenieOccupancy,
+    CatGenieProblemSensor,
+    CatGenieRunningSensor,
+    CatGenieSaniSolutionSensor,
+    CatGenieSwitch,
+)
+
+# Relative slowdown reported as a regression by --compare.
+REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass
+class Result:
+    """Outcome of a single benchmark."""
+
+    name: str
+    ops_per_sec: float
+    peak_kib_per_op: float
+    extra: dict[str, Any]
+
+
+async def _call(func: Callable[[], Any]) -> None:
+    """Run a benchmark operation, awaiting it if needed."""
+    result = func()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def measure(
+    name: str,
+    func: Callable[[], Awaitable[Any] | Any],
+    duration: float,
+    **extra: Any,
+) -> Result:
+    """Time ``func`` for ``duration`` seconds and trace one extra call."""
+    await _call(func)
+
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        await _call(func)
+        iterations += 1
+
+    tracemalloc.start()
+    await _call(func)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(name, iterations / elapsed, peak / 1024, extra)
+
+
+def _make_coordinator(
+    hass: HomeAssistant,
+    device_count: int,
+) -> tuple[CatGenieCoordinator, StubSession]:
+    """Create a coordinator backed by a stub session."""
+    session = StubSession(device_count)
+    client = CatGenieApiClient(refresh_token="benchmark", session=session)  # type: ignore[arg-type]
+    return CatGenieCoordinator(hass=hass, client=client), session
+
+
+async def bench_from_dict(device_count: int, duration: float) -> Result:
+    """Parse every device of a ``/device/device`` response."""
+    objs = devices(device_count)
+
+    def parse() -> list[DeviceData]:
+        return [DeviceData.from_dict(obj) for obj in objs]
+
+    return await measure(f"from_dict[{device_count}]", parse, duration)
+
+
+async def bench_update_cycle(
+    hass: HomeAssistant,
+    device_count: int,
+    duration: float,
+) -> list[Result]:
+    """Run full and status-only coordinator update cycles."""
+    coordinator, session = _make_coordinator(hass, device_count)
+
+    async def full_cycle() -> None:
+        coordinator.data = None  # type: ignore[assignment]
+        coordinator._devices_fingerprint = None
+        coordinator.data = await coordinator._async_update_data()
+
+    async def status_cycle() -> None:
+        coordinator.data = await coordinator._async_update_data()
+
+    full = await measure(f"update_full[{device_count}]", full_cycle, duration)
+    session.requests.clear()
+    await full_cycle()
+    full.extra["requests"] = sum(session.requests.values())
+
+    coordinator._next_full_refresh = float("inf")
+    status = await measure(f"update_status[{device_count}]", status_cycle, duration)
+    session.requests.clear()
+    await status_cycle()
+    status.extra["requests"] = sum(session.requests.values())
+    return [full, status]
+
+
+async def bench_fanout(
+    hass: HomeAssistant,
+    device_count: int,
+    duration: float,
+) -> Result:
+    """Dispatch an operation status change to every entity of the fleet."""
+    coordinator, _ = _make_coordinator(hass, device_count)
+    coordinator.data = await coordinator._async_update_data()
+
+    writes = 0
+
+    def count_write() -> None:
+        nonlocal writes
+        writes += 1
+
+    entities = []
+    for device_id in coordinator.data:
+        for entity_class in ENTITY_CLASSES:
+            entity = entity_class(coordinator=coordinator, device_id=device_id)
+            entity.hass = hass
+            entity.entity_id = f"benchmark.{device_id}_{len(entities)}"
+            entity.async_write_ha_state = count_write  # type: ignore[method-assign]
+            coordinator.async_add_listener(
+                entity._handle_coordinator_update,
+                entity.coordinator_context,
+            )
+            entities.append(entity)
+
+    idle = coordinator.data
+    running = {
+        device_id: replace(
+            device,
+            operation_status=replace(device.operation_status, state=1),
+        )
+        for device_id, device in idle.items()
+    }
+    coordinator.async_update_listeners()
+
+    def toggle() -> None:
+        previous = coordinator.data
+        current = running if previous is idle else idle
+        coordinator._set_changed(previous, current)
+        coordinator.data = current
+        coordinator.async_update_listeners()
+
+    result = await measure(f"fanout[{device_count}]", toggle, duration)
+    writes = 0
+    toggle()
+    result.extra["entities"] = len(entities)
+    result.extra["writes"] = writes
+    return result
+
+
+async def run(duration: float) -> list[Result]:
+    """Run every benchmark for every fleet size."""
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for device_count in DEVICE_COUNTS:
+            results.append(await bench_from_dict(device_count, duration))
+            results.extend(await bench_update_cycle(hass, device_count, duration))
+            results.append(await bench_fanout(hass, device_count, duration))
+    return results
+
+
+def _report(results: list[Result], baseline: dict[str, Any] | None) -> int:
+    """Print the results and return the number of regressions."""
+    regressions = 0
+    print(f"{'benchmark':<24}{'ops/sec':>14}{'peak KiB/op':>14}  notes")
+    for result in results:
+        notes = " ".join(f"{key}={value:g}" for key, value in result.extra.items())
+        if baseline is not None and result.name in baseline:
+            before = baseline[result.name]["ops_per_sec"]
+            change = result.ops_per_sec / before - 1
+            notes = f"{change:+.1%} {notes}"
+            if change < -REGRESSION_THRESHOLD:
+                regressions += 1
+                notes = f"REGRESSION {notes}"
+        print(
+            f"{result.name:<24}{result.ops_per_sec:>14,.1f}"
+            f"{result.peak_kib_per_op:>14,.1f}  {notes}",
+        )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=1.0,
+        help="seconds to run each benchmark for",
+    )
+    parser.add_argument("--json", type=Path, help="write the results to a file")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="compare against results written earlier with --json",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.duration))
+
+    baseline = None
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    regressions = _report(results, baseline)
+
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps({result.name: asdict(result) for result in results}, indent=2),
+            encoding="utf-8",
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
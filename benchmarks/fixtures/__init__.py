@@ -0,0 +1,52 @@
+"""Recorded CatGenie cloud responses used by the benchmarks."""
+
+from __future__ import annotations
+
+import copy
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).parent
+
+# Fleet sizes every benchmark is run against.
+DEVICE_COUNTS = (1, 10, 500)
+
+
+@cache
+def _load(name: str) -> Any:
+    """Load a recorded response."""
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def device_id(index: int) -> str:
+    """Return the manufacturer id of the device at ``index``."""
+    return f"CG{index:09d}"
+
+
+def devices(count: int) -> list[dict[str, Any]]:
+    """Return ``count`` copies of the recorded device with unique ids."""
+    result = []
+    for index in range(count):
+        obj = copy.deepcopy(_load("device.json"))
+        obj["manufacturerId"] = device_id(index)
+        obj["name"] = f"Litter Box {index}"
+        obj["macAddress"] = f"A4:CF:12:{index >> 16 & 0xFF:02X}:{index >> 8 & 0xFF:02X}:{index & 0xFF:02X}"
+        result.append(obj)
+    return result
+
+
+def devices_payload(count: int) -> bytes:
+    """Return a ``/device/device`` response body with ``count`` devices."""
+    return json.dumps({"thingList": devices(count)}).encode()
+
+
+def status(**changes: Any) -> dict[str, Any]:
+    """Return the recorded operation status with optional changes."""
+    return {**_load("status.json"), **changes}
+
+
+def status_payload(**changes: Any) -> bytes:
+    """Return an ``/operation/status`` response body."""
+    return json.dumps(status(**changes)).encode()
@@ -0,0 +1,233 @@
+"""Local stand-in for the CatGenie cloud at iot.petnovations.com.
+
+Serves the endpoints used by ``CatGenieApiClient`` for a fleet of virtual
+boxes that run simulated cleaning cycles, with configurable latency and
+fault injection::
+
+    python -m benchmarks.mock_server --devices 300 --latency 0.08 --error-rate 0.02
+
+Point a client at it by creating its session with the server URL as the
+``base_url``; any refresh token is accepted::
+
+    session = aiohttp.ClientSession(base_url="http://127.0.0.1:8765")
+    client = CatGenieApiClient(refresh_token="mock", session=session)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+from .fixtures import devices, status
+
+# Operation states accepted by POST .../operation, see DeviceOperation.
+OPERATION_ON = 1
+OPERATION_OFF = 2
+OPERATION_RESUME = 3
+OPERATION_FULL_CLEAN = 4
+
+CYCLE_STEPS = 12
+
+
+@dataclass
+class MockOptions:
+    """Behaviour of the mock cloud."""
+
+    devices: int = 10
+    latency: float = 0.0
+    jitter: float = 0.0
+    token_ttl: float = 3600.0
+    cycle_duration: float = 600.0
+    cycle_every: float = 3600.0
+    unauthorized_rate: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 30.0
+    seed: int | None = None
+
+
+@dataclass
+class VirtualBox:
+    """A simulated litter box."""
+
+    obj: dict[str, Any]
+    cycle_started: float | None = None
+    next_cycle: float = 0.0
+    stopped_progress: int = 0
+
+    @property
+    def device_id(self) -> str:
+        """Return the manufacturer id."""
+        return self.obj["manufacturerId"]
+
+
+@dataclass
+class MockCloud:
+    """State and request handlers of the mock cloud."""
+
+    options: MockOptions
+    boxes: dict[str, VirtualBox] = field(default_factory=dict)
+    tokens: dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+
+    def __post_init__(self) -> None:
+        """Create the virtual boxes with staggered cleaning schedules."""
+        self.random = random.Random(self.options.seed)
+        now = time.monotonic()
+        for obj in devices(self.options.devices):
+            box = VirtualBox(obj)
+            box.next_cycle = now + self.random.uniform(0, self.options.cycle_every)
+            self.boxes[box.device_id] = box
+
+    def _operation_status(self, box: VirtualBox, now: float) -> dict[str, Any]:
+        """Advance the simulated cycle of a box and return its status."""
+        if box.cycle_started is None and now >= box.next_cycle:
+            box.cycle_started = now
+        if box.cycle_started is None:
+            return status(state=0, progress=box.stopped_progress, stepNum=0)
+
+        elapsed = now - box.cycle_started
+        if elapsed >= self.options.cycle_duration:
+            box.cycle_started = None
+            box.stopped_progress = 0
+            box.next_cycle = now + self.options.cycle_every
+            box.obj["usedSaniSolution"] += 1
+            box.obj["remainingSaniSolution"] = max(
+                box.obj["remainingSaniSolution"] - 1,
+                0,
+            )
+            return status(state=0, progress=0, stepNum=0)
+
+        fraction = elapsed / self.options.cycle_duration
+        return status(
+            state=1,
+            progress=int(fraction * 100),
+            stepNum=int(fraction * CYCLE_STEPS) + 1,
+        )
+
+    async def _inject_faults(self, request: web.Request) -> None:
+        """Apply latency and random failures to a request."""
+        self.requests += 1
+        options = self.options
+        delay = options.latency + self.random.uniform(0, options.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.random.random()
+        if roll < options.timeout_rate:
+            await asyncio.sleep(options.timeout)
+        roll -= options.timeout_rate
+        if roll < options.error_rate:
+            raise web.HTTPServiceUnavailable
+        roll -= options.error_rate
+        if roll < options.unauthorized_rate and request.path != "/facade/v1/mobile-user/refreshToken":
+            raise web.HTTPUnauthorized
+
+    def _authorize(self, request: web.Request) -> None:
+        """Reject requests without a valid, unexpired access token."""
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        expiration = self.tokens.get(token)
+        if expiration is None or expiration <= time.time():
+            raise web.HTTPUnauthorized
+
+    def _box(self, request: web.Request) -> VirtualBox:
+        """Return the box addressed by the request."""
+        box = self.boxes.get(request.match_info["device_id"])
+        if box is None:
+            raise web.HTTPNotFound
+        return box
+
+    async def refresh_token(self, request: web.Request) -> web.Response:
+        """Issue a new access token for any refresh token."""
+        await self._inject_faults(request)
+        body = await request.json()
+        if not body.get("refreshToken"):
+            raise web.HTTPUnauthorized
+        token = secrets.token_urlsafe(24)
+        expiration = time.time() + self.options.token_ttl
+        self.tokens[token] = expiration
+        return web.json_response(
+            {"token": token, "expiration": int(expiration * 1000)},
+        )
+
+    async def device_list(self, request: web.Request) -> web.Response:
+        """Return every box with its current operation status."""
+        await self._inject_faults(request)
+        self._authorize(request)
+        now = time.monotonic()
+        thing_list = [
+            {**box.obj, "operationStatus": self._operation_status(box, now)}
+            for box in self.boxes.values()
+        ]
+        return web.json_response({"thingList": thing_list})
+
+    async def operation_status(self, request: web.Request) -> web.Response:
+        """Return the operation status of a box."""
+        await self._inject_faults(request)
+        self._authorize(request)
+        box = self._box(request)
+        return web.json_response(self._operation_status(box, time.monotonic()))
+
+    async def operation(self, request: web.Request) -> web.Response:
+        """Start or stop the cleaning cycle of a box."""
+        await self._inject_faults(request)
+        self._authorize(request)
+        box = self._box(request)
+        state = (await request.json()).get("state")
+        now = time.monotonic()
+        if state in (OPERATION_ON, OPERATION_RESUME, OPERATION_FULL_CLEAN):
+            if box.cycle_started is None:
+                box.cycle_started = now
+        elif state == OPERATION_OFF:
+            if box.cycle_started is not None:
+                progress = (now - box.cycle_started) / self.options.cycle_duration
+                box.stopped_progress = int(progress * 100)
+            box.cycle_started = None
+            box.next_cycle = now + self.options.cycle_every
+        else:
+            raise web.HTTPBadRequest
+        return web.Response(status=200)
+
+
+def create_app(options: MockOptions) -> web.Application:
+    """Create the mock cloud application."""
+    cloud = MockCloud(options)
+    app = web.Application()
+    app["cloud"] = cloud
+    app.router.add_post("/facade/v1/mobile-user/refreshToken", cloud.refresh_token)
+    app.router.add_get("/device/device", cloud.device_list)
+    app.router.add_get(
+        "/device/management/{device_id}/operation/status",
+        cloud.operation_status,
+    )
+    app.router.add_post("/device/management/{device_id}/operation", cloud.operation)
+    return app
+
+
+def main() -> None:
+    """Run the mock cloud from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    defaults = MockOptions()
+    for name, value in vars(defaults).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=type(value) if value is not None else int,
+            default=value,
+        )
+    args = parser.parse_args()
+    options = MockOptions(
+        **{name: getattr(args, name) for name in vars(defaults)},
+    )
+    web.run_app(create_app(options), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
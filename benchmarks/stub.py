@@ -0,0 +1,71 @@
+"""In-process stand-in for the aiohttp session used by the API client."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections import Counter
+from typing import Any
+
+import aiohttp
+
+from .fixtures import devices_payload, status_payload
+
+_STATUS_URL = re.compile(r"^/device/management/(?P<device_id>[^/]+)/operation/status$")
+_OPERATION_URL = re.compile(r"^/device/management/(?P<device_id>[^/]+)/operation$")
+
+
+class StubResponse:
+    """Minimal ``aiohttp.ClientResponse`` replacement."""
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        """Raise for error status codes."""
+        if self.status >= 400:
+            raise aiohttp.ClientError(self.status)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def json(self) -> Any:
+        """Return the decoded body."""
+        return json.loads(self._body)
+
+
+class StubSession:
+    """Answer CatGenie API requests from the recorded fixtures.
+
+    Response bodies are built once, so the benchmarks measure the client
+    and coordinator rather than fixture generation.
+    """
+
+    def __init__(self, device_count: int) -> None:
+        """Initialize the session for a fleet of ``device_count`` boxes."""
+        self.requests: Counter[str] = Counter()
+        self.devices_body = devices_payload(device_count)
+        self.status_body = status_payload()
+
+    async def post(self, url: str, **kwargs: Any) -> StubResponse:
+        """Handle a POST request."""
+        return await self.request(aiohttp.hdrs.METH_POST, url, **kwargs)
+
+    async def request(self, method: str, url: str, **_: Any) -> StubResponse:
+        """Handle a request."""
+        self.requests[url] += 1
+        if url == "/facade/v1/mobile-user/refreshToken":
+            expiration = int((time.time() + 3600) * 1000)
+            body = json.dumps({"token": "benchmark", "expiration": expiration})
+            return StubResponse(body.encode())
+        if url == "/device/device":
+            return StubResponse(self.devices_body)
+        if _STATUS_URL.match(url):
+            return StubResponse(self.status_body)
+        if method == aiohttp.hdrs.METH_POST and _OPERATION_URL.match(url):
+            return StubResponse(b"")
+        return StubResponse(b"", status=404)
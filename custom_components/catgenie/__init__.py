@@ -8,19 +8,30 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aiohttp import hdrs
-from homeassistant.const import CONF_TOKEN, Platform
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.const import CONF_DEVICES, CONF_TOKEN, Platform
+from homeassistant.helpers import config_validation as cv
 
 from .api import CatGenieApiClient
-from .const import DOMAIN, HOST
+from .cache import async_pop_validated
+from .const import (
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DOMAIN,
+)
 from .coordinator import CatGenieCoordinator
+from .data import CatGenieData
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .session import async_get_circuit_breaker, async_get_session
+from .store import CatGenieSnapshotStore, CatGenieTokenStore
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
-    from .data import DeviceData
+    from .data import CatGenieConfigEntry
 
 
 PLATFORMS: list[Platform] = [
@@ -29,38 +40,67 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the services shared by every config entry."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry[DeviceData],
+    entry: CatGenieConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    scheduler = async_get_scheduler(hass)
+    token_store = CatGenieTokenStore(hass, entry.entry_id)
+    snapshot_store = CatGenieSnapshotStore(hass, entry.entry_id)
+    client = CatGenieApiClient(
+        refresh_token=entry.data[CONF_TOKEN],
+        session=async_get_session(hass),
+        circuit_breaker=async_get_circuit_breaker(hass),
+        on_token_refresh=token_store.async_save,
+        request_budget=scheduler.budget,
+        timeout_floor=entry.options.get(CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR),
+        timeout_ceiling=entry.options.get(
+            CONF_TIMEOUT_CEILING,
+            DEFAULT_TIMEOUT_CEILING,
+        ),
+    )
     coordinator = CatGenieCoordinator(
         hass=hass,
-        client=CatGenieApiClient(
-            refresh_token=entry.data[CONF_TOKEN],
-            session=async_create_clientsession(
-                hass,
-                base_url=f"https://{HOST}",
-                headers={
-                    hdrs.HOST: HOST,
-                    hdrs.USER_AGENT: "CatGenie/493 CFNetwork/1559 Darwin/24.0.0",
-                    hdrs.CONNECTION: "keep-alive",
-                    hdrs.ACCEPT: "application/json, text/plain, */*",
-                    hdrs.ACCEPT_ENCODING: "gzip, deflate, br",
-                    hdrs.ACCEPT_LANGUAGE: "en-US,en;q=0.9",
-                },
-            ),
-        ),
+        client=client,
+        options=entry.options,
+        snapshot_store=snapshot_store,
+        device_ids=entry.data.get(CONF_DEVICES),
+        scheduler=scheduler,
     )
-
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data[DOMAIN] = {
-        "coordinator": coordinator,
-    }
+    entry.async_on_unload(scheduler.async_register(coordinator))
+
+    # Reuse what the config flow fetched when the entry was just created.
+    if (validated := async_pop_validated(hass, entry.data[CONF_TOKEN])) is not None:
+        client.set_access_token(validated.access_token, validated.expiration)
+        token_store.async_save(validated.access_token, validated.expiration)
+        coordinator.async_set_prefetched(validated.devices_payload)
+    elif (token := await token_store.async_load()) is not None:
+        client.set_access_token(*token)
+
+    # Start from the last known devices so setup does not wait for the cloud.
+    if snapshot := await snapshot_store.async_load():
+        coordinator.async_load_snapshot(snapshot)
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} {entry.entry_id} first refresh",
+        )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
+
+    entry.runtime_data = CatGenieData(client=client, coordinator=coordinator)
 
     # async_add_entities(
     #     CatGenieEntity(coordinator, idx) for idx, ent in enumerate(coordinator.data)
@@ -73,16 +113,24 @@ async def async_setup_entry(
 
 async def async_unload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CatGenieConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: CatGenieConfigEntry,
+) -> None:
+    """Remove the stored data of a deleted entry."""
+    await CatGenieTokenStore(hass, entry.entry_id).async_remove()
+    await CatGenieSnapshotStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CatGenieConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
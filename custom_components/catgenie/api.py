@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
 import socket
-from datetime import datetime, timezone
-from typing import Any
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    ENDPOINT_REFRESH,
+    HOST,
+    LOGGER,
+)
+from .latency import LatencyHistogram, endpoint_key
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from .scheduler import RequestBudget
+
+# Renew the access token in the background once it is this close to expiry.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
+
+# Idempotent requests are retried with capped, fully jittered exponential
+# backoff: a random delay of up to RETRY_BACKOFF * 2**attempt seconds.
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 4.0
+
+# Consecutive communication failures that open a host's circuit breaker,
+# and how long it stays open before a trial request is let through.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60.0
 
 
 class CatGenieApiClientError(Exception):
@@ -26,6 +60,12 @@ class CatGenieApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class CatGenieApiClientCircuitOpenError(
+    CatGenieApiClientCommunicationError,
+):
+    """Exception to indicate requests are rejected while the cloud is down."""
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -36,6 +76,122 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+class CircuitBreaker:
+    """Fail fast while a host keeps failing.
+
+    The breaker opens after ``failure_threshold`` consecutive communication
+    failures and rejects requests for ``reset_timeout`` seconds. A single
+    trial request is then let through; its outcome closes or re-opens the
+    breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the breaker."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    def before_request(self) -> bool:
+        """Raise if the breaker does not let a request through.
+
+        Returns True when the request is the trial of a half-open breaker.
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - (self.opened_at or 0.0) < self.reset_timeout:
+                msg = f"Circuit breaker for {self.host} is open"
+                raise CatGenieApiClientCircuitOpenError(
+                    msg,
+                )
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                msg = f"Circuit breaker for {self.host} is waiting on a trial request"
+                raise CatGenieApiClientCircuitOpenError(
+                    msg,
+                )
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after the host answered."""
+        if self.state != self.CLOSED:
+            LOGGER.info("Circuit breaker for %s closed", self.host)
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Let another trial through after one ended without an outcome.
+
+        A cancelled trial neither closes nor re-opens the breaker, so the
+        next request becomes the trial instead.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a communication failure, opening the breaker if needed."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            LOGGER.warning(
+                "Circuit breaker for %s opened after %s failures",
+                self.host,
+                self.failures,
+            )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "host": self.host,
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "open_for": (
+                None
+                if self.opened_at is None
+                else round(time.monotonic() - self.opened_at, 1)
+            ),
+        }
+
+
+def decode_json(payload: bytes) -> Any:
+    """Decode a response body, treating an empty body as no content.
+
+    The bytes are decoded directly by Home Assistant's orjson based
+    ``json_loads``, without going through ``str``.
+    """
+    if not payload:
+        return None
+    try:
+        return json_loads(payload)
+    except ValueError as exception:
+        msg = f"Invalid JSON response - {exception}"
+        raise CatGenieApiClientError(
+            msg,
+        ) from exception
+
+
 class CatGenieApiClient:
     """Sample API Client."""
 
@@ -43,31 +199,66 @@ class CatGenieApiClient:
         self,
         refresh_token: str,
         session: aiohttp.ClientSession,
+        on_token_refresh: Callable[[str, datetime], None] | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        request_budget: RequestBudget | None = None,
+        timeout_floor: float = DEFAULT_TIMEOUT_FLOOR,
+        timeout_ceiling: float = DEFAULT_TIMEOUT_CEILING,
     ) -> None:
         """Sample API Client."""
         self._refresh_token = refresh_token
-        self._access_token = None
+        self._access_token: str | None = None
         self._session = session
         self._token_expiration = datetime.now(timezone.utc)
-
-    async def async_get_first_device(self) -> Any:
-        """Get data from the API."""
-        resp = await self.async_get_devices()
-        return resp[0]
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._on_token_refresh = on_token_refresh
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(HOST)
+        self._request_budget = request_budget
+        self._inflight: dict[tuple[str, bool], asyncio.Task[Any]] = {}
+        self._timeout_floor = timeout_floor
+        self._timeout_ceiling = timeout_ceiling
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.request_counts: Counter[str] = Counter()
+        self.token_refreshes = 0
+        self.token_refresh_failures = 0
 
     async def async_get_devices(self) -> list[dict[str, Any]]:
         """Obtain the list of devices associated to a user."""
-        resp = await self._api_wrapper(
+        return self.parse_devices(await self.async_get_devices_payload())
+
+    async def async_get_devices_payload(self) -> bytes:
+        """Obtain the undecoded device list response."""
+        return await self._api_wrapper(
             aiohttp.hdrs.METH_GET,
             url="/device/device",
+            decode=False,
         )
-        return resp["thingList"]
+
+    @staticmethod
+    def fingerprint(payload: bytes) -> int:
+        """Return a cheap fingerprint of a raw response body.
+
+        Equal bodies have equal fingerprints, so callers can skip decoding
+        a payload that did not change. The hash of a bytes object is
+        cached on it, and it is only stable within a process.
+        """
+        return hash(payload)
+
+    @staticmethod
+    def parse_devices(payload: bytes) -> list[dict[str, Any]]:
+        """Decode a device list response."""
+        return decode_json(payload)["thingList"]
 
     async def async_get_device_status(self, device_id: str) -> Any:
-        """Obtain the list of devices associated to a user."""
+        """Obtain the operation status of a device."""
+        return decode_json(await self.async_get_device_status_payload(device_id))
+
+    async def async_get_device_status_payload(self, device_id: str) -> bytes:
+        """Obtain the undecoded operation status response of a device."""
         return await self._api_wrapper(
             method=aiohttp.hdrs.METH_GET,
             url=f"/device/management/{device_id}/operation/status",
+            decode=False,
         )
 
     async def async_device_operation(self, device_id: str, state: int = 1) -> Any:
@@ -82,7 +273,43 @@ class CatGenieApiClient:
         """Check if the token is expired."""
         if self._access_token is None:
             return True
-        return self._token_expiration >= datetime.now(timezone.utc)
+        return self._token_expiration <= datetime.now(timezone.utc)
+
+    def _is_token_expiring(self) -> bool:
+        """Check if the token is due for a proactive refresh."""
+        return (
+            self._token_expiration - TOKEN_REFRESH_MARGIN
+            <= datetime.now(timezone.utc)
+        )
+
+    async def _async_ensure_token(self) -> None:
+        """Make sure a usable access token is available.
+
+        Only an expired token blocks the caller; a token close to expiry is
+        renewed in the background while the current one is still used.
+        """
+        if self._is_token_expired():
+            await self.async_refresh_token()
+        elif self._is_token_expiring() and self._refresh_task is None:
+            self._start_refresh().add_done_callback(self._log_background_refresh)
+
+    @staticmethod
+    def _log_background_refresh(task: asyncio.Task[None]) -> None:
+        """Log the outcome of a background token refresh."""
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            LOGGER.warning("Background token refresh failed: %s", exception)
+
+    def set_access_token(self, access_token: str, expiration: datetime) -> None:
+        """Reuse a previously obtained access token."""
+        self._access_token = access_token
+        self._token_expiration = expiration
+
+    @property
+    def token(self) -> tuple[str, datetime] | None:
+        """Return the current access token and its expiration."""
+        if self._access_token is None:
+            return None
+        return self._access_token, self._token_expiration
 
     def has_access_token(self) -> bool:
         """Check if the token is expired."""
@@ -95,21 +322,36 @@ class CatGenieApiClient:
             return {aiohttp.hdrs.AUTHORIZATION: f"Bearer {self._access_token}"}
         return {}
 
+    def _start_refresh(self) -> asyncio.Task[None]:
+        """Return the in-flight token refresh, starting one if needed."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._async_refresh_token(),
+            )
+        return self._refresh_task
+
     async def async_refresh_token(self) -> None:
-        """Obtain a valid access token."""
-        if self._access_token is not None:
-            self._access_token = None
+        """Obtain a valid access token.
 
+        Concurrent callers share a single in-flight refresh request.
+        """
+        await asyncio.shield(self._start_refresh())
+
+    async def _async_refresh_token(self) -> None:
+        """Request a new access token from the API."""
         try:
-            async with async_timeout.timeout(10):
+            if self._request_budget is not None:
+                await self._request_budget.acquire()
+            async with self._async_timed(aiohttp.hdrs.METH_POST, ENDPOINT_REFRESH):
                 response = await self._session.post(
-                    url="/facade/v1/mobile-user/refreshToken",
+                    url=ENDPOINT_REFRESH,
                     json={"refreshToken": self._refresh_token},
-                    headers=self.headers,
+                    # Never the expired or rejected access token.
+                    headers={},
                 )
                 _verify_response_or_raise(response)
 
-                data = await response.json()
+                data = decode_json(await response.read())
 
                 expiration = data["expiration"]
                 access_token = data["token"]
@@ -120,11 +362,70 @@ class CatGenieApiClient:
                     float(int(expiration) / 1000),
                     timezone.utc,
                 )
+
+                if self._on_token_refresh is not None:
+                    self._on_token_refresh(access_token, self._token_expiration)
+                self.token_refreshes += 1
+        except CatGenieApiClientError:
+            self.token_refresh_failures += 1
+            raise
+        except (TimeoutError, aiohttp.ClientError, socket.gaierror) as exception:
+            self.token_refresh_failures += 1
+            msg = f"Error refreshing token - {exception}"
+            raise CatGenieApiClientCommunicationError(
+                msg,
+            ) from exception
         except Exception as exception:  # pylint: disable=broad-except
+            self.token_refresh_failures += 1
             msg = f"Error refreshing token - {exception}"
             raise CatGenieApiClientError(
                 msg,
             ) from exception
+        finally:
+            self._refresh_task = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the request statistics of the client for diagnostics."""
+        return {
+            "token_expiration": self._token_expiration.isoformat(),
+            "token_refreshes": self.token_refreshes,
+            "token_refresh_failures": self.token_refresh_failures,
+            "endpoints": {
+                endpoint: {
+                    "requests": count,
+                    "timeout": self.latency[endpoint].timeout(
+                        self._timeout_floor,
+                        self._timeout_ceiling,
+                    ),
+                    **self.latency[endpoint].as_dict(),
+                }
+                for endpoint, count in self.request_counts.items()
+            },
+            "circuit_breaker": self.circuit_breaker.as_dict(),
+        }
+
+    @asynccontextmanager
+    async def _async_timed(self, method: str, url: str) -> AsyncIterator[None]:
+        """Time out a request from the observed latency of its endpoint.
+
+        The timeout is a multiple of the endpoint's p95 latency, or a fixed
+        cold start timeout until enough requests were seen, kept between the
+        configured floor and ceiling.
+        """
+        endpoint = endpoint_key(method, url)
+        self.request_counts[endpoint] += 1
+        if (histogram := self.latency.get(endpoint)) is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        timeout = histogram.timeout(self._timeout_floor, self._timeout_ceiling)
+        started = time.monotonic()
+        try:
+            async with async_timeout.timeout(timeout):
+                yield
+        except TimeoutError:
+            LOGGER.debug("%s timed out after %.1fs", endpoint, timeout)
+            histogram.record(timeout, timed_out=True)
+            raise
+        histogram.record(time.monotonic() - started)
 
     async def _api_wrapper_inner(
         self,
@@ -132,13 +433,15 @@ class CatGenieApiClient:
         url: str,
         data: dict[Any,Any] | None = None,
         headers: dict[str,str] | None = None,
-    ) -> Any:
-        """Get information from the API."""
+    ) -> bytes:
+        """Get the raw response body from the API."""
         real_headers = self.headers
         if headers is not None:
             real_headers.update(headers)
 
-        async with async_timeout.timeout(10):
+        if self._request_budget is not None:
+            await self._request_budget.acquire()
+        async with self._async_timed(method, url):
             response = await self._session.request(
                 method=method,
                 url=url,
@@ -146,7 +449,7 @@ class CatGenieApiClient:
                 json=data,
             )
             _verify_response_or_raise(response)
-            return await response.json()
+            return await response.read()
 
     async def _api_wrapper(
         self,
@@ -154,34 +457,134 @@ class CatGenieApiClient:
         url: str,
         data: dict[Any,Any] | None = None,
         headers: dict[str,str] | None = None,
+        *,
+        decode: bool = True,
     ) -> Any:
-        """Get information from the API."""
-        if self._is_token_expired():
-            await self.async_refresh_token()
+        """Get information from the API.
 
-        try:
-            return await self._api_wrapper_inner(
-                method=method,
-                url=url,
-                data=data,
-                headers=headers,
+        Returns the decoded JSON body, or the raw bytes when ``decode`` is
+        false so callers can skip decoding an unchanged payload. Concurrent
+        GET requests for the same URL share one request and its result.
+        """
+        if method != aiohttp.hdrs.METH_GET or data is not None or headers is not None:
+            return await self._api_wrapper_retry(method, url, data, headers, decode=decode)
+
+        key = (url, decode)
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.get_running_loop().create_task(
+                self._api_wrapper_retry(method, url, decode=decode),
             )
-        except CatGenieApiClientAuthenticationError:
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # A cancelled caller must not cancel the request of the others.
+        return await asyncio.shield(task)
+
+    def close(self) -> None:
+        """Cancel the shared requests still in flight.
+
+        They are shielded from their callers, so nothing else stops their
+        retries once the client is no longer used.
+        """
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+    def _forget_inflight(self, key: tuple[str, bool], task: asyncio.Task[Any]) -> None:
+        """Drop a finished shared request so the next call starts afresh."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have been cancelled; mark the error as retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def _api_wrapper_retry(
+        self,
+        method: str,
+        url: str,
+        data: dict[Any,Any] | None = None,
+        headers: dict[str,str] | None = None,
+        *,
+        decode: bool = True,
+    ) -> Any:
+        """Send a request, retrying GET requests that fail to reach the cloud."""
+        attempts = RETRY_ATTEMPTS if method == aiohttp.hdrs.METH_GET else 1
+        for attempt in range(attempts):
+            trial = self.circuit_breaker.before_request()
+            try:
+                payload = await self._api_wrapper_request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    headers=headers,
+                )
+            except CatGenieApiClientCommunicationError as exception:
+                self.circuit_breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+                delay = random.uniform(  # noqa: S311
+                    0,
+                    min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt),
+                )
+                LOGGER.debug("Retrying %s %s in %.2fs: %s", method, url, delay, exception)
+                await asyncio.sleep(delay)
+            except CatGenieApiClientError:
+                self.circuit_breaker.record_success()
+                raise
+            except BaseException:
+                # Cancelled, e.g. by a command queue on shutdown.
+                if trial:
+                    self.circuit_breaker.release_trial()
+                raise
+            else:
+                self.circuit_breaker.record_success()
+                break
+        if decode:
+            return decode_json(payload)
+        return payload
+
+    async def _api_wrapper_request(
+        self,
+        method: str,
+        url: str,
+        data: dict[Any,Any] | None = None,
+        headers: dict[str,str] | None = None,
+    ) -> bytes:
+        """Get the raw response body, refreshing the token when needed."""
+        await self._async_ensure_token()
+        access_token = self._access_token
+
+        try:
             try:
-                await self.async_refresh_token()
                 return await self._api_wrapper_inner(
                     method=method,
                     url=url,
                     data=data,
                     headers=headers,
                 )
-            except Exception as exception:  # pylint: disable=broad-except
-                msg = f"Something really wrong happened! - {exception}"
+            except CatGenieApiClientAuthenticationError:
+                # Another request may already have replaced the rejected token.
+                if self._access_token == access_token:
+                    await self.async_refresh_token()
+                return await self._api_wrapper_inner(
+                    method=method,
+                    url=url,
+                    data=data,
+                    headers=headers,
+                )
+        except CatGenieApiClientError:
+            # Raised as is, so a rejected refresh token still fails
+            # authentication and a refresh timeout is still retried.
+            raise
+        except TimeoutError as exception:
+            msg = f"Timeout error fetching information - {exception}"
+            raise CatGenieApiClientCommunicationError(
+                msg,
+            ) from exception
+        except aiohttp.ClientResponseError as exception:
+            msg = f"Error fetching information - {exception}"
+            if exception.status < 500:
                 raise CatGenieApiClientError(
                     msg,
                 ) from exception
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
             raise CatGenieApiClientCommunicationError(
                 msg,
             ) from exception
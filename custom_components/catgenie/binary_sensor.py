@@ -10,32 +10,34 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN, LOGGER
+from .const import LOGGER
 from .entity import CatGenieEntity
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import CatGenieCoordinator
+    from .data import CatGenieConfigEntry, DeviceData
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # Unused function argument: `hass`
-    entry: ConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: CatGenieConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
     LOGGER.info(f"Setting up binary_sensor platform: {entry.entry_id}")
-    coordinator = hass.data[DOMAIN]["coordinator"]
+    coordinator = entry.runtime_data.coordinator
 
     async_add_entities(
-        {
-            CatGenieProblemSensor(coordinator=coordinator),
-            CatGenieConnectivitySensor(coordinator=coordinator),
-            CatGenieRunningSensor(coordinator=coordinator),
-            CatGenieOccupancy(coordinator=coordinator),
-        },
+        entity_class(coordinator=coordinator, device_id=device_id)
+        for device_id in coordinator.data
+        for entity_class in (
+            CatGenieProblemSensor,
+            CatGenieConnectivitySensor,
+            CatGenieRunningSensor,
+            CatGenieOccupancy,
+        )
     )
 
 
@@ -45,7 +47,7 @@ class CatGenieBinarySensor(CatGenieEntity, BinarySensorEntity):
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_{self.device_class}"
+        return f"{self._device_id}_{self.device_class}"
 
     @property
     def name(self) -> str:
@@ -55,9 +57,10 @@ class CatGenieBinarySensor(CatGenieEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: CatGenieCoordinator,
+        device_id: str,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         device_class = self._attr_device_class
         if device_class is None:
             # device_class = BinarySensorDeviceClass.POWER
@@ -68,10 +71,6 @@ class CatGenieBinarySensor(CatGenieEntity, BinarySensorEntity):
         #     device_class=device_class,
         # )
 
-    def is_on(self) -> (bool | None):
-        """Return true if the binary_sensor is on."""
-        return self._attr_is_on
-
 class CatGenieConnectivitySensor(
     CatGenieBinarySensor,
     BinarySensorEntity,
@@ -79,6 +78,7 @@ class CatGenieConnectivitySensor(
     """integration_blueprint binary_sensor class."""
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _device_fields = ("reported_status",)
 
     @property
     def name(self) -> str:
@@ -88,13 +88,12 @@ class CatGenieConnectivitySensor(
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_connectivity"
+        return f"{self._device_id}_connectivity"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data.reported_status == "connected"
-        self.async_write_ha_state()
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_is_on = device.reported_status == "connected"
 
 class CatGenieRunningSensor(
     CatGenieBinarySensor,
@@ -103,6 +102,7 @@ class CatGenieRunningSensor(
     """integration_blueprint binary_sensor class."""
 
     _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _device_fields = ("operation_status.state",)
 
     @property
     def name(self) -> str:
@@ -112,13 +112,12 @@ class CatGenieRunningSensor(
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_running"
+        return f"{self._device_id}_running"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data.operation_status.state > 0
-        self.async_write_ha_state()
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_is_on = device.operation_status.state > 0
 
 
 class CatGenieProblemSensor(
@@ -128,6 +127,7 @@ class CatGenieProblemSensor(
     """integration_blueprint binary_sensor class."""
 
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _device_fields = ("operation_status.error",)
     @property
     def name(self) -> str:
         """Return the name of the entity."""
@@ -136,13 +136,12 @@ class CatGenieProblemSensor(
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_problem"
+        return f"{self._device_id}_problem"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data.operation_status.error != ""
-        self.async_write_ha_state()
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_is_on = device.operation_status.error != ""
 
 class CatGenieOccupancy(
     CatGenieBinarySensor,
@@ -151,6 +150,7 @@ class CatGenieOccupancy(
     """integration_blueprint binary_sensor class."""
 
     _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+    _device_fields = ("operation_status.sens",)
     @property
     def name(self) -> str:
         """Return the name of the entity."""
@@ -159,14 +159,9 @@ class CatGenieOccupancy(
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_occupancy"
+        return f"{self._device_id}_occupancy"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data.operation_status.sens is None:
-            self._attr_is_on = False
-        str_sens = str(self.coordinator.data.operation_status.sens)
-        if len(str_sens) > 0:
-            self._attr_is_on = True
-        self.async_write_ha_state()
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_is_on = bool(device.operation_status.sens)
@@ -0,0 +1,69 @@
+"""Short-lived cache of accounts validated by the config flow."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import DOMAIN, VALIDATION_CACHE_TTL
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+DATA_VALIDATED = f"{DOMAIN}_validated"
+
+
+@dataclass
+class ValidatedAccount:
+    """Result of a successful credential check."""
+
+    access_token: str
+    expiration: datetime
+    devices_payload: bytes
+    expires_at: float
+
+
+def _key(refresh_token: str) -> str:
+    """Return the cache key of a refresh token without keeping it around."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+@callback
+def _async_cache(hass: HomeAssistant) -> dict[str, ValidatedAccount]:
+    """Return the cache with expired accounts removed."""
+    cache: dict[str, ValidatedAccount] = hass.data.setdefault(DATA_VALIDATED, {})
+    now = time.monotonic()
+    for key in [key for key, account in cache.items() if account.expires_at <= now]:
+        del cache[key]
+    return cache
+
+
+@callback
+def async_cache_validated(
+    hass: HomeAssistant,
+    refresh_token: str,
+    token: tuple[str, datetime],
+    devices_payload: bytes,
+) -> None:
+    """Remember the token and device list fetched for a refresh token."""
+    _async_cache(hass)[_key(refresh_token)] = ValidatedAccount(
+        access_token=token[0],
+        expiration=token[1],
+        devices_payload=devices_payload,
+        expires_at=time.monotonic() + VALIDATION_CACHE_TTL,
+    )
+
+
+@callback
+def async_pop_validated(
+    hass: HomeAssistant,
+    refresh_token: str,
+) -> ValidatedAccount | None:
+    """Take the cached validation result for a refresh token, if any."""
+    return _async_cache(hass).pop(_key(refresh_token), None)
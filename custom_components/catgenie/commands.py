@@ -0,0 +1,98 @@
+"""Per-device queue for the operations sent to CatGenie boxes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class DeviceCommandQueue:
+    """Serialises the operations sent to one device.
+
+    A command waits ``debounce`` seconds before it is sent; commands
+    submitted in the meantime supersede it, so a burst such as ON, OFF, ON
+    results in a single request. Every caller gets its own future, resolved
+    with the state that was actually sent. Commands submitted while one is
+    in flight are sent after it.
+    """
+
+    def __init__(
+        self,
+        device_id: str,
+        send: Callable[[str, int], Awaitable[Any]],
+        debounce: float,
+    ) -> None:
+        """Initialize."""
+        self._device_id = device_id
+        self._send = send
+        self._debounce = debounce
+        self._pending: int | None = None
+        self._waiters: list[asyncio.Future[int]] = []
+        self._worker: asyncio.Task[None] | None = None
+
+    def submit(self, state: int) -> asyncio.Future[int]:
+        """Queue an operation and return the future of this caller."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+        if self._pending is not None and self._pending != state:
+            LOGGER.debug(
+                "Operation %s on %s superseded by %s",
+                self._pending,
+                self._device_id,
+                state,
+            )
+        self._pending = state
+        self._waiters.append(future)
+        if self._worker is None:
+            self._worker = loop.create_task(self._async_run())
+        return future
+
+    async def _async_run(self) -> None:
+        """Send the latest queued operation until the queue is empty."""
+        waiters: list[asyncio.Future[int]] = []
+        try:
+            while self._pending is not None:
+                await asyncio.sleep(self._debounce)
+                state, self._pending = self._pending, None
+                waiters, self._waiters = self._waiters, []
+                try:
+                    await self._send(self._device_id, state)
+                except Exception as exception:  # noqa: BLE001
+                    # Not swallowed: every caller gets the error to handle.
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(exception)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(state)
+                waiters = []
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            # cancel() already reset a queue whose worker it cancelled.
+            if self._worker is asyncio.current_task():
+                self._reset()
+
+    def _reset(self) -> None:
+        """Cancel the queued callers and forget the worker."""
+        for waiter in self._waiters:
+            waiter.cancel()
+        self._worker = None
+        self._pending = None
+        self._waiters = []
+
+    def cancel(self) -> None:
+        """Stop sending and cancel the futures of every waiting caller.
+
+        The queue is reset here rather than by the worker, which does not
+        run its cleanup when it is cancelled before it started.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+        self._reset()
@@ -6,9 +6,9 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.const import CONF_NAME, CONF_TOKEN
+from homeassistant.const import CONF_DEVICES, CONF_NAME, CONF_TOKEN
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import (
     CatGenieApiClient,
@@ -16,7 +16,30 @@ from .api import (
     CatGenieApiClientCommunicationError,
     CatGenieApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .cache import async_cache_validated
+from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_FLEET_SHARD_SIZE,
+    CONF_FULL_REFRESH_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_OFFLINE_INTERVAL,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_FLEET_SHARD_SIZE,
+    DEFAULT_FULL_REFRESH_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_OFFLINE_INTERVAL,
+    DEFAULT_STALE_MAX_AGE,
+    DEFAULT_STALE_MAX_FAILURES,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DOMAIN,
+    LOGGER,
+)
+from .session import async_get_circuit_breaker, async_get_session
 
 
 class CatGenieHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,6 +47,19 @@ class CatGenieHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._user_input: dict[str, Any] = {}
+        self._devices: list[dict[str, Any]] = []
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> CatGenieOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return CatGenieOptionsFlowHandler()
+
     async def async_step_user( # type: ignore reportInconsistentMethodOverride
         self,
         user_input: dict[str, Any] | None = None,
@@ -32,7 +68,7 @@ class CatGenieHandler(config_entries.ConfigFlow, domain=DOMAIN):
         _errors = {}
         if user_input is not None:
             try:
-                await self._test_credentials(
+                self._devices = await self._test_credentials(
                     refresh_token=user_input[CONF_TOKEN],
                 )
             except CatGenieApiClientAuthenticationError as exception:
@@ -45,6 +81,9 @@ class CatGenieHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exception)
                 _errors["base"] = "unknown"
             else:
+                self._user_input = user_input
+                if len(self._devices) > 1:
+                    return await self.async_step_devices()
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
                     data=user_input,
@@ -72,10 +111,172 @@ class CatGenieHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors, # type: ignore reportGeneralTypeq
         ) # type: ignore reportGeneralType
 
-    async def _test_credentials(self, refresh_token: str) -> None:
-        """Validate credentials."""
+    async def async_step_devices(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Let the user pick which devices of the account to add."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_DEVICES]:
+                return self.async_create_entry(
+                    title=self._user_input[CONF_NAME],
+                    data={**self._user_input, CONF_DEVICES: user_input[CONF_DEVICES]},
+                ) # type: ignore reportGeneralType
+            _errors["base"] = "no_devices"
+
+        device_ids = [obj.get("manufacturerId", "") for obj in self._devices]
+        return self.async_show_form(
+            step_id="devices",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_DEVICES,
+                        default=device_ids,
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=obj.get("manufacturerId", ""),
+                                    label=obj.get("name")
+                                    or f"Litter Box {obj.get('manufacturerId', '')}",
+                                )
+                                for obj in self._devices
+                            ],
+                            multiple=True,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors, # type: ignore reportGeneralTypeq
+        ) # type: ignore reportGeneralType
+
+    async def _test_credentials(self, refresh_token: str) -> list[dict[str, Any]]:
+        """Validate credentials and return the devices of the account.
+
+        The access token and device list are cached briefly so setting up
+        the new entry does not fetch them again.
+        """
         client = CatGenieApiClient(
             refresh_token=refresh_token,
-            session=async_create_clientsession(self.hass),
+            session=async_get_session(self.hass),
+            circuit_breaker=async_get_circuit_breaker(self.hass),
         )
-        await client.async_get_devices()
+        payload = await client.async_get_devices_payload()
+        if (token := client.token) is not None:
+            async_cache_validated(self.hass, refresh_token, token, payload)
+        return client.parse_devices(payload)
+
+
+def _interval_selector(maximum: int) -> selector.NumberSelector:
+    """Build a number selector for a polling interval in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1,
+            max=maximum,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+class CatGenieOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for polling, stale data, fleet mode and timeouts."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="",
+                data={key: int(value) for key, value in user_input.items()},
+            )  # type: ignore reportGeneralType
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ACTIVE_INTERVAL,
+                        default=options.get(
+                            CONF_ACTIVE_INTERVAL,
+                            DEFAULT_ACTIVE_INTERVAL,
+                        ),
+                    ): _interval_selector(300),
+                    vol.Required(
+                        CONF_IDLE_INTERVAL,
+                        default=options.get(
+                            CONF_IDLE_INTERVAL,
+                            DEFAULT_IDLE_INTERVAL,
+                        ),
+                    ): _interval_selector(3600),
+                    vol.Required(
+                        CONF_OFFLINE_INTERVAL,
+                        default=options.get(
+                            CONF_OFFLINE_INTERVAL,
+                            DEFAULT_OFFLINE_INTERVAL,
+                        ),
+                    ): _interval_selector(3600),
+                    vol.Required(
+                        CONF_FULL_REFRESH_INTERVAL,
+                        default=options.get(
+                            CONF_FULL_REFRESH_INTERVAL,
+                            DEFAULT_FULL_REFRESH_INTERVAL,
+                        ),
+                    ): _interval_selector(86400),
+                    vol.Required(
+                        CONF_STALE_MAX_FAILURES,
+                        default=options.get(
+                            CONF_STALE_MAX_FAILURES,
+                            DEFAULT_STALE_MAX_FAILURES,
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_STALE_MAX_AGE,
+                        default=options.get(
+                            CONF_STALE_MAX_AGE,
+                            DEFAULT_STALE_MAX_AGE,
+                        ),
+                    ): _interval_selector(86400),
+                    vol.Required(
+                        CONF_FLEET_SHARD_SIZE,
+                        default=options.get(
+                            CONF_FLEET_SHARD_SIZE,
+                            DEFAULT_FLEET_SHARD_SIZE,
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=500,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_TIMEOUT_FLOOR,
+                        default=options.get(
+                            CONF_TIMEOUT_FLOOR,
+                            DEFAULT_TIMEOUT_FLOOR,
+                        ),
+                    ): _interval_selector(60),
+                    vol.Required(
+                        CONF_TIMEOUT_CEILING,
+                        default=options.get(
+                            CONF_TIMEOUT_CEILING,
+                            DEFAULT_TIMEOUT_CEILING,
+                        ),
+                    ): _interval_selector(120),
+                },
+            ),
+        )  # type: ignore reportGeneralType
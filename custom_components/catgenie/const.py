@@ -10,3 +10,74 @@ ATTRIBUTION: Final[str] = "Data provided by http://jsonplaceholder.typicode.com/
 
 HOST: Final[str] = "iot.petnovations.com"
 ENDPOINT_REFRESH: Final[str] = "/facade/v1/mobile-user/refreshToken"
+
+CONF_ACTIVE_INTERVAL: Final[str] = "active_interval"
+CONF_IDLE_INTERVAL: Final[str] = "idle_interval"
+CONF_OFFLINE_INTERVAL: Final[str] = "offline_interval"
+
+# Polling intervals, in seconds.
+DEFAULT_UPDATE_INTERVAL: Final[int] = 20
+DEFAULT_ACTIVE_INTERVAL: Final[int] = 5
+DEFAULT_IDLE_INTERVAL: Final[int] = 300
+DEFAULT_OFFLINE_INTERVAL: Final[int] = 900
+
+# Delays, in seconds, between status checks after a command is sent.
+COMMAND_CONFIRM_DELAYS: Final[tuple[float, ...]] = (0.5, 0.5, 1.0, 1.0, 2.0)
+# Time, in seconds, a command waits for a superseding one before it is sent.
+COMMAND_DEBOUNCE: Final[float] = 0.3
+
+CONF_FULL_REFRESH_INTERVAL: Final[str] = "full_refresh_interval"
+
+# How often, in seconds, the full device list is downloaded. Polls in
+# between only hit the per-device operation status endpoint.
+DEFAULT_FULL_REFRESH_INTERVAL: Final[int] = 900
+
+STORAGE_VERSION: Final[int] = 1
+# Debounce, in seconds, for writing the access token to disk.
+TOKEN_SAVE_DELAY: Final[int] = 10
+# Debounce, in seconds, for writing the device snapshot to disk.
+SNAPSHOT_SAVE_DELAY: Final[int] = 60
+
+CONF_STALE_MAX_FAILURES: Final[str] = "stale_max_failures"
+CONF_STALE_MAX_AGE: Final[str] = "stale_max_age"
+
+# Failed polls tolerated, and the oldest data served, in seconds, before
+# entities become unavailable.
+DEFAULT_STALE_MAX_FAILURES: Final[int] = 3
+DEFAULT_STALE_MAX_AGE: Final[int] = 600
+
+# Connection pool of the shared session to the cloud. Connections are kept
+# alive between polls so TLS handshakes are not repeated.
+SESSION_CONNECTION_LIMIT: Final[int] = 16
+SESSION_KEEPALIVE_TIMEOUT: Final[int] = 120
+SESSION_DNS_CACHE_TTL: Final[int] = 300
+
+# How long, in seconds, the result of a credential check in the config flow
+# is kept for the setup of the entry it creates.
+VALIDATION_CACHE_TTL: Final[int] = 300
+
+# Request budget shared by every account: requests per second, and the
+# burst allowed after a quiet period.
+REQUEST_BUDGET_RATE: Final[float] = 10.0
+REQUEST_BUDGET_BURST: Final[float] = 30.0
+
+CONF_FLEET_SHARD_SIZE: Final[str] = "fleet_shard_size"
+
+# Fleet mode splits the devices of an account into shards of this many
+# boxes and polls one shard per tick; 0 polls every box on every tick.
+DEFAULT_FLEET_SHARD_SIZE: Final[int] = 0
+# Status requests of one tick in flight at once.
+FLEET_CONCURRENCY: Final[int] = 8
+# Shortest time, in seconds, between two fleet mode ticks.
+FLEET_MIN_TICK_INTERVAL: Final[int] = 1
+
+# Commands of a bulk operation sent at once, matching the connection pool.
+BULK_OPERATION_CONCURRENCY: Final[int] = SESSION_CONNECTION_LIMIT
+
+CONF_TIMEOUT_FLOOR: Final[str] = "timeout_floor"
+CONF_TIMEOUT_CEILING: Final[str] = "timeout_ceiling"
+
+# Bounds, in seconds, of the request timeouts derived from the observed
+# latency of each endpoint.
+DEFAULT_TIMEOUT_FLOOR: Final[int] = 2
+DEFAULT_TIMEOUT_CEILING: Final[int] = 20
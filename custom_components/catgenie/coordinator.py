@@ -2,23 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import replace
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     CatGenieApiClient,
     CatGenieApiClientAuthenticationError,
+    CatGenieApiClientCommunicationError,
     CatGenieApiClientError,
+    decode_json,
 )
-from .const import DOMAIN, LOGGER
-from .data import DeviceData
+from .commands import DeviceCommandQueue
+from .const import (
+    COMMAND_CONFIRM_DELAYS,
+    COMMAND_DEBOUNCE,
+    CONF_ACTIVE_INTERVAL,
+    CONF_FLEET_SHARD_SIZE,
+    CONF_FULL_REFRESH_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_OFFLINE_INTERVAL,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_FAILURES,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_FLEET_SHARD_SIZE,
+    DEFAULT_FULL_REFRESH_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_OFFLINE_INTERVAL,
+    DEFAULT_STALE_MAX_AGE,
+    DEFAULT_STALE_MAX_FAILURES,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    FLEET_CONCURRENCY,
+    FLEET_MIN_TICK_INTERVAL,
+    LOGGER,
+)
+from .data import DeviceData, OperationStatus, changed_fields
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Mapping
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
 
+    from .scheduler import CatGenieScheduler
+    from .store import CatGenieSnapshotStore
+
 class UnknownError(Exception):
     """Raised when an unknown error occurs during update."""
 
@@ -27,34 +63,524 @@ class UnknownError(Exception):
         super().__init__(f"Unknown error: {args}")
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class CatGenieCoordinator(DataUpdateCoordinator[DeviceData]):
-    """Class to manage fetching data from the API."""
+class CatGenieCoordinator(DataUpdateCoordinator[dict[str, DeviceData]]):
+    """Class to manage fetching data for every device on the account."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: CatGenieApiClient,
+        options: Mapping[str, Any] | None = None,
+        snapshot_store: CatGenieSnapshotStore | None = None,
+        device_ids: Collection[str] | None = None,
+        scheduler: CatGenieScheduler | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=20),
-            always_update=True,
+            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            always_update=False,
         )
         self.client = client
+        self.stale = False
+        self.failure_streak = 0
+        self.last_successful_update: datetime | None = None
+        self._snapshot_store = snapshot_store
+        self._scheduler = scheduler
+        self._device_ids = frozenset(device_ids or ())
+        self._prefetched_payload: bytes | None = None
+        self._raw_devices: dict[str, dict[str, Any]] = {}
+        self._devices_fingerprint: int | None = None
+        self._status_fingerprints: dict[str, int] = {}
+        # Changed field paths per device for the most recent update; an
+        # empty path stands for the whole device.
+        self.changed: dict[str, set[str]] = {}
+        self._subscriptions: dict[str, dict[str, list[CALLBACK_TYPE]]] | None = None
+        self._unsubscribed: list[CALLBACK_TYPE] = []
+        self._dispatched_availability: tuple[bool, bool] | None = None
+        self._command_queues: dict[str, DeviceCommandQueue] = {}
+        self._shard_cursor = 0
+        self._status_semaphore = asyncio.Semaphore(FLEET_CONCURRENCY)
+        # Event loop time, in seconds, spent decoding and dispatching the
+        # current tick, and the total of the last completed tick.
+        self._tick_loop_time = 0.0
+        self.last_tick_loop_time = 0.0
+        # Instrumentation for diagnostics: wall time of the last update, time
+        # spent in DeviceData.from_dict by the last full refresh and state
+        # writes made or skipped by the entities.
+        self.last_update_duration: float | None = None
+        self.last_parse_time = 0.0
+        self.devices_parsed = 0
+        self.entity_writes = 0
+        self.entity_writes_skipped = 0
+
+        options = options or {}
+        self._active_interval = timedelta(
+            seconds=options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+        )
+        self._idle_interval = timedelta(
+            seconds=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+        )
+        self._offline_interval = timedelta(
+            seconds=options.get(CONF_OFFLINE_INTERVAL, DEFAULT_OFFLINE_INTERVAL),
+        )
+        self._full_refresh_interval: float = options.get(
+            CONF_FULL_REFRESH_INTERVAL,
+            DEFAULT_FULL_REFRESH_INTERVAL,
+        )
+        self._next_full_refresh = 0.0
+        self._stale_max_failures: int = options.get(
+            CONF_STALE_MAX_FAILURES,
+            DEFAULT_STALE_MAX_FAILURES,
+        )
+        self._stale_max_age = timedelta(
+            seconds=options.get(CONF_STALE_MAX_AGE, DEFAULT_STALE_MAX_AGE),
+        )
+        self._fleet_shard_size: int = options.get(
+            CONF_FLEET_SHARD_SIZE,
+            DEFAULT_FLEET_SHARD_SIZE,
+        )
+
+    def async_load_snapshot(self, snapshot: list[dict[str, Any]]) -> None:
+        """Serve a stored device list until the first live refresh.
+
+        Entities can be created from it straight away; the data is marked
+        stale until a request to the cloud succeeds.
+        """
+        devices: dict[str, DeviceData] = {}
+        for obj in snapshot:
+            device = DeviceData.from_dict(obj)
+            devices[device.manufacturer_id] = device
+            self._raw_devices[device.manufacturer_id] = obj
+        self._set_changed(None, devices)
+        self.data = devices
+        self.stale = True
+
+    def async_set_prefetched(self, payload: bytes) -> None:
+        """Use an already downloaded device list for the next full refresh."""
+        self._prefetched_payload = payload
+
+    def _next_update_interval(
+        self,
+        previous: dict[str, DeviceData] | None,
+        current: dict[str, DeviceData],
+    ) -> timedelta:
+        """Pick the polling interval from the decoded operation status.
+
+        The busiest device wins: any cycle in progress polls fast, a fully
+        settled account polls slowly and an account with every box offline
+        backs off further.
+        """
+        if not current or not any(device.online for device in current.values()):
+            return self._offline_interval
+
+        settled = True
+        for device_id, device in current.items():
+            before = (previous or {}).get(device_id)
+            status = device.operation_status
+            if status.state > 0:
+                if before is None or (
+                    status.progress != before.operation_status.progress
+                    or status.step_num != before.operation_status.step_num
+                ):
+                    return self._active_interval
+                settled = False
+            elif before is None or device.reported_status != before.reported_status:
+                settled = False
+
+        if settled:
+            return self._idle_interval
+        return timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+
+    def _shards(self, device_ids: Collection[str]) -> list[list[str]]:
+        """Split the devices into the shards polled in turn in fleet mode.
+
+        Shards are interleaved over the sorted device ids, so their sizes
+        differ by at most one box.
+        """
+        size = self._fleet_shard_size
+        if size <= 0 or len(device_ids) <= size:
+            return [list(device_ids)]
+        count = -(-len(device_ids) // size)
+        ordered = sorted(device_ids)
+        return [ordered[index::count] for index in range(count)]
+
+    def _set_changed(
+        self,
+        previous: dict[str, DeviceData] | None,
+        current: dict[str, DeviceData],
+    ) -> None:
+        """Record which fields of which devices differ from the last update."""
+        self.changed = {}
+        for device_id, device in current.items():
+            before = (previous or {}).get(device_id)
+            if before is None:
+                self.changed[device_id] = {""}
+            elif before is not device and (changed := changed_fields(before, device)):
+                self.changed[device_id] = changed
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        A ``(device_id, field_paths)`` context subscribes the listener to
+        those fields only; an empty tuple subscribes to the whole device.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._subscriptions = None
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            self._subscriptions = None
+
+        return _remove_listener
+
+    def _build_subscriptions(self) -> dict[str, dict[str, list[CALLBACK_TYPE]]]:
+        """Index the field subscriptions of the listeners by device and path."""
+        subscriptions: dict[str, dict[str, list[CALLBACK_TYPE]]] = {}
+        self._unsubscribed = []
+        for update_callback, context in self._listeners.values():
+            if not isinstance(context, tuple):
+                self._unsubscribed.append(update_callback)
+                continue
+            device_id, paths = context
+            by_path = subscriptions.setdefault(device_id, {})
+            for path in paths or ("",):
+                by_path.setdefault(path, []).append(update_callback)
+        return subscriptions
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners and report the event loop time of the tick."""
+        started = time.perf_counter()
+        self._async_dispatch_listeners()
+        self.last_tick_loop_time = (
+            self._tick_loop_time + time.perf_counter() - started
+        )
+        self._tick_loop_time = 0.0
+        LOGGER.debug(
+            "Update of %s used %.1f ms of event loop time",
+            self.name,
+            self.last_tick_loop_time * 1000,
+        )
 
-    async def _async_update_data(self) -> DeviceData:
-        """Update data via library."""
-        if not self.client.has_access_token():
-            await self.client.async_refresh_token()
+    @callback
+    def _async_dispatch_listeners(self) -> None:
+        """Notify only the listeners subscribed to fields that changed.
+
+        A change notifies the listeners of the changed path, of the paths
+        containing it and of the paths within it; lazy sections such as
+        ``configuration`` are only reported as a whole. Every listener is
+        notified when availability or staleness changes.
+        """
+        availability = (self.last_update_success, self.stale)
+        if self._dispatched_availability != availability:
+            self._dispatched_availability = availability
+            super().async_update_listeners()
+            return
+
+        if self._subscriptions is None:
+            self._subscriptions = self._build_subscriptions()
+        callbacks: dict[CALLBACK_TYPE, None] = dict.fromkeys(self._unsubscribed)
+        for device_id, paths in self.changed.items():
+            if (by_path := self._subscriptions.get(device_id)) is None:
+                continue
+            if "" in paths:
+                for path_callbacks in by_path.values():
+                    callbacks.update(dict.fromkeys(path_callbacks))
+                continue
+            callbacks.update(dict.fromkeys(by_path.get("", ())))
+            for changed_path in paths:
+                path = changed_path
+                while True:
+                    callbacks.update(dict.fromkeys(by_path.get(path, ())))
+                    if "." not in path:
+                        break
+                    path = path.rpartition(".")[0]
+                prefix = f"{changed_path}."
+                for subscribed, path_callbacks in by_path.items():
+                    if subscribed.startswith(prefix):
+                        callbacks.update(dict.fromkeys(path_callbacks))
+
+        for update_callback in callbacks:
+            update_callback()
+
+    async def _async_fetch_devices(self) -> dict[str, DeviceData]:
+        """Download and parse the full device list.
+
+        A single ``/device/device`` request returns every device on the
+        account, so all of them are parsed from the same response. An
+        identical response body is not decoded at all, and devices whose
+        raw object did not change keep their parsed ``DeviceData``. When
+        devices were selected in the config flow, only those are kept.
+        """
+        if self._prefetched_payload is not None:
+            payload, self._prefetched_payload = self._prefetched_payload, None
+        else:
+            payload = await self.client.async_get_devices_payload()
+        self._next_full_refresh = time.monotonic() + self._full_refresh_interval
+        fingerprint = self.client.fingerprint(payload)
+        if self.data and fingerprint == self._devices_fingerprint:
+            return self.data
+        self._devices_fingerprint = fingerprint
+
+        devices: dict[str, DeviceData] = {}
+        raw_devices: dict[str, dict[str, Any]] = {}
+        parse_time = 0.0
+        size = self._fleet_shard_size
+        started = time.perf_counter()
+        for index, obj in enumerate(self.client.parse_devices(payload)):
+            # In fleet mode, hand the event loop back between shards.
+            if size > 0 and index and index % size == 0:
+                self._tick_loop_time += time.perf_counter() - started
+                await asyncio.sleep(0)
+                started = time.perf_counter()
+            device_id = obj.get("manufacturerId", "")
+            if self._device_ids and device_id not in self._device_ids:
+                continue
+            if (
+                self.data
+                and device_id in self.data
+                and self._raw_devices.get(device_id) == obj
+            ):
+                devices[device_id] = self.data[device_id]
+            else:
+                parse_started = time.perf_counter()
+                devices[device_id] = DeviceData.from_dict(obj)
+                parse_time += time.perf_counter() - parse_started
+                self.devices_parsed += 1
+                # The status may differ from the last polled one, so the next
+                # status poll must not be skipped as unchanged.
+                self._status_fingerprints.pop(device_id, None)
+            raw_devices[device_id] = obj
+        self._tick_loop_time += time.perf_counter() - started
+        self.last_parse_time = parse_time
+        self._raw_devices = raw_devices
+        return devices
+
+    async def _async_get_status_payload(self, device_id: str) -> bytes:
+        """Fetch the operation status of a device, bounded by the semaphore."""
+        async with self._status_semaphore:
+            return await self.client.async_get_device_status_payload(device_id)
+
+    async def _async_fetch_operation_status(
+        self,
+        cached: dict[str, DeviceData],
+    ) -> dict[str, DeviceData]:
+        """Refresh only the operation status of the cached devices.
+
+        In fleet mode only the next shard of devices is polled. Falls back
+        to the full device list when a status request fails or a cleaning
+        cycle has just finished, since firmware, configuration and
+        sani-solution fields only change on the slow tier.
+        """
+        shards = self._shards(cached)
+        shard = shards[self._shard_cursor % len(shards)]
+        self._shard_cursor += 1
+        payloads = await asyncio.gather(
+            *(self._async_get_status_payload(device_id) for device_id in shard),
+            return_exceptions=True,
+        )
+        started = time.perf_counter()
+        devices = dict(cached)
+        for device_id, payload in zip(shard, payloads, strict=True):
+            device = cached[device_id]
+            if isinstance(payload, CatGenieApiClientAuthenticationError):
+                raise payload
+            if isinstance(payload, BaseException):
+                LOGGER.debug("Status poll for %s failed: %s", device_id, payload)
+                return await self._async_fetch_devices()
+            fingerprint = self.client.fingerprint(payload)
+            if fingerprint == self._status_fingerprints.get(device_id):
+                continue
+            self._status_fingerprints[device_id] = fingerprint
+            result = decode_json(payload)
+            status = OperationStatus.from_dict(result)
+            if device_id in self._raw_devices:
+                self._raw_devices[device_id] = {
+                    **self._raw_devices[device_id],
+                    "operationStatus": result,
+                }
+            if device.operation_status.state > 0 and status.state == 0:
+                self._next_full_refresh = 0.0
+            devices[device_id] = replace(device, operation_status=status)
+        self._tick_loop_time += time.perf_counter() - started
+        return devices
+
+    async def _async_update_data(self) -> dict[str, DeviceData]:
+        """Update data via library and record how long it took."""
+        started = time.perf_counter()
+        try:
+            return await self._async_update_devices()
+        finally:
+            self.last_update_duration = time.perf_counter() - started
+
+    async def _async_update_devices(self) -> dict[str, DeviceData]:
+        """Fetch the devices on the fast or the slow tier.
+
+        The fast tier only merges ``/operation/status`` into the cached
+        devices; the full device list is fetched on the slow tier.
+        """
+        was_stale = self.stale
         try:
-            result = await self.client.async_get_first_device()
-            return DeviceData.from_dict(result)
+            if not self.client.has_access_token():
+                await self.client.async_refresh_token()
+            if not self.data or time.monotonic() >= self._next_full_refresh:
+                devices = await self._async_fetch_devices()
+            else:
+                devices = await self._async_fetch_operation_status(self.data)
         except CatGenieApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
+        except CatGenieApiClientCommunicationError as exception:
+            devices = self._serve_stale(exception)
+            # Entities must hear about the switch to stale data.
+            self.always_update = not was_stale
+            return devices
         except CatGenieApiClientError as exception:
             raise UpdateFailed(exception) from exception
         except Exception as exception:
             raise UnknownError from exception
+
+        started = time.perf_counter()
+        interval = self._next_update_interval(self.data, devices)
+        # Spread the polls of the shards evenly over the interval, so every
+        # device is still refreshed once per interval.
+        if (shards := len(self._shards(devices))) > 1:
+            interval = max(
+                interval / shards,
+                timedelta(seconds=FLEET_MIN_TICK_INTERVAL),
+            )
+        if self._scheduler is not None:
+            interval = self._scheduler.align(self, interval)
+        self.update_interval = interval
+        # Entities flag stale data, so they must hear about the first live
+        # update even when none of the values changed.
+        self.always_update = was_stale
+        self._set_changed(None if was_stale else self.data, devices)
+        self.stale = False
+        self.failure_streak = 0
+        self.last_successful_update = dt_util.utcnow()
+        if self.changed and self._snapshot_store is not None:
+            self._snapshot_store.async_save(list(self._raw_devices.values()))
+        self._tick_loop_time += time.perf_counter() - started
+        return devices
+
+    @property
+    def raw_devices(self) -> dict[str, dict[str, Any]]:
+        """Return the raw API objects of the current devices."""
+        return self._raw_devices
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the update statistics of the coordinator for diagnostics."""
+        return {
+            "update_interval": self.update_interval.total_seconds()
+            if self.update_interval
+            else None,
+            "last_update_success": self.last_update_success,
+            "last_successful_update": self.last_successful_update.isoformat()
+            if self.last_successful_update
+            else None,
+            "last_update_duration": self.last_update_duration,
+            "last_tick_loop_time": self.last_tick_loop_time,
+            "stale": self.stale,
+            "failure_streak": self.failure_streak,
+            "devices": len(self.data or {}),
+            "devices_parsed": self.devices_parsed,
+            "last_parse_time": self.last_parse_time,
+            "entity_writes": self.entity_writes,
+            "entity_writes_skipped": self.entity_writes_skipped,
+        }
+
+    def _serve_stale(self, exception: Exception) -> dict[str, DeviceData]:
+        """Keep serving the last good data during a short cloud outage.
+
+        Raises ``UpdateFailed`` once too many polls in a row have failed or
+        the data is older than the configured maximum age.
+        """
+        self.failure_streak += 1
+        if (
+            not self.data
+            or self.last_successful_update is None
+            or self.failure_streak > self._stale_max_failures
+            or dt_util.utcnow() - self.last_successful_update > self._stale_max_age
+        ):
+            raise UpdateFailed(exception) from exception
+
+        LOGGER.debug(
+            "Serving stale data after %s failed polls: %s",
+            self.failure_streak,
+            exception,
+        )
+        self.stale = True
+        self.changed = {}
+        return self.data
+
+    async def async_device_operation(self, device_id: str, state: int) -> int:
+        """Send an operation through the command queue of the device.
+
+        Returns the state that was sent, which differs from ``state`` when
+        a later command superseded it.
+        """
+        if (queue := self._command_queues.get(device_id)) is None:
+            queue = self._command_queues[device_id] = DeviceCommandQueue(
+                device_id,
+                self.client.async_device_operation,
+                COMMAND_DEBOUNCE,
+            )
+        return await queue.submit(state)
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued commands and shared requests and stop refreshing."""
+        for queue in self._command_queues.values():
+            queue.cancel()
+        self.client.close()
+        await super().async_shutdown()
+
+    async def async_confirm_operation(
+        self,
+        device_id: str,
+        confirmed: Callable[[OperationStatus], bool],
+    ) -> bool:
+        """Poll the status endpoint until a command is reflected.
+
+        Runs a short, bounded burst of ``/operation/status`` requests and
+        pushes the first matching status to the entities without a full
+        device list refresh. Falls back to a regular refresh when the
+        burst runs out.
+        """
+        for delay in COMMAND_CONFIRM_DELAYS:
+            await asyncio.sleep(delay)
+            try:
+                result = await self.client.async_get_device_status(device_id)
+            except CatGenieApiClientError as exception:
+                LOGGER.debug("Status check for %s failed: %s", device_id, exception)
+                continue
+            status = OperationStatus.from_dict(result)
+            if confirmed(status):
+                self.async_set_operation_status(device_id, status)
+                return True
+
+        LOGGER.debug("Operation on %s was not confirmed, refreshing", device_id)
+        await self.async_request_refresh()
+        return False
+
+    def async_set_operation_status(
+        self,
+        device_id: str,
+        status: OperationStatus,
+    ) -> None:
+        """Merge a fresh operation status into the cached device data."""
+        if self.data is None or device_id not in self.data:
+            return
+        devices = dict(self.data)
+        devices[device_id] = replace(devices[device_id], operation_status=status)
+        self._status_fingerprints.pop(device_id, None)
+        self._set_changed(self.data, devices)
+        self.async_set_updated_data(devices)
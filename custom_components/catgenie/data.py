@@ -2,189 +2,325 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields, is_dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeAlias, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from homeassistant.config_entries import ConfigEntry
+
+    from .api import CatGenieApiClient
+    from .coordinator import CatGenieCoordinator
+
+CatGenieConfigEntry: TypeAlias = "ConfigEntry[CatGenieData]"
 
 
 @dataclass
+class CatGenieData:
+    """Runtime data of a config entry, one per account."""
+
+    client: CatGenieApiClient
+    coordinator: CatGenieCoordinator
+
+
+_ModelT = TypeVar("_ModelT")
+_SectionT = TypeVar("_SectionT")
+
+# Stands in for a missing nested section without allocating a dict.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+# Shared ``extra`` of every model without unknown keys; never mutated.
+_NO_EXTRA: Mapping[str, Any] = {}
+# Marks a lazy section that has not been decoded yet.
+_UNDECODED: Any = object()
+# Field metadata of the raw object that lazy sections are decoded from.
+_RAW = MappingProxyType({"raw": True})
+
+
+class _LazySection(Generic[_SectionT]):
+    """Section of a model decoded from its raw object on first access.
+
+    The result is cached on the instance, so it is decoded at most once per
+    snapshot; ``dataclasses.replace`` starts over from the raw object.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        decode: Callable[[Any], _SectionT],
+        empty: Any = _EMPTY,
+    ) -> None:
+        """Initialize."""
+        self.key = key
+        self._decode = decode
+        self._empty = empty
+        self._cache = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Store the decoded section in the slot named after it."""
+        self._cache = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _LazySection[_SectionT]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> _SectionT: ...
+
+    def __get__(self, instance: object | None, owner: type) -> Any:
+        """Return the decoded section."""
+        if instance is None:
+            return self
+        value = getattr(instance, self._cache)
+        if value is _UNDECODED:
+            raw: Mapping[str, Any] = instance.raw  # type: ignore[attr-defined]
+            value = self._decode(raw.get(self.key) or self._empty)
+            setattr(instance, self._cache, value)
+        return value
+
+
+def _lazy_sections(cls: type) -> dict[str, str]:
+    """Return the API key of every lazy section of a model by name."""
+    return {
+        name: value.key
+        for name, value in vars(cls).items()
+        if isinstance(value, _LazySection)
+    }
+
+
+def _undecoded() -> Any:
+    """Return the cache field of a lazy section."""
+    return field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+
+def _camel_case(name: str) -> str:
+    """Return the API key of a field, ``step_num`` becomes ``stepNum``."""
+    head, *tail = name.split("_")
+    return head + "".join(part.title() for part in tail)
+
+
+def _build_decoder(
+    cls: type[Any],
+    renamed: Mapping[str, str],
+) -> Callable[[Mapping[str, Any]], Any]:
+    """Generate the ``from_dict`` function of a model from its fields.
+
+    The API key of every field is its camelCase name unless ``renamed``
+    says otherwise. Nested models are decoded with their own decoder and
+    keys the model does not know are kept in ``extra``. Lazy sections are
+    left in the raw object, which is kept as is.
+    """
+    namespace: dict[str, Any] = {
+        "cls": cls,
+        "EMPTY": _EMPTY,
+        "NO_EXTRA": _NO_EXTRA,
+    }
+    arguments: list[str] = []
+    known = set(_lazy_sections(cls).values())
+    for index, item in enumerate(fields(cls)):
+        if not item.init:
+            continue
+        if item.metadata.get("raw"):
+            arguments.append("obj")
+            continue
+        if item.name == "extra":
+            arguments.append(
+                "NO_EXTRA if obj.keys() <= known"
+                " else {key: obj[key] for key in obj.keys() - known}",
+            )
+            continue
+        key = renamed.get(item.name, _camel_case(item.name))
+        known.add(key)
+        factory = item.default_factory
+        if is_dataclass(factory):
+            namespace[f"decode_{index}"] = factory.from_dict  # type: ignore[attr-defined]
+            arguments.append(f"decode_{index}(get({key!r}) or EMPTY)")
+        elif factory is list or factory is dict:
+            arguments.append(f"get({key!r}) or {'[]' if factory is list else '{}'}")
+        elif item.default is None:
+            arguments.append(f"get({key!r})")
+        else:
+            namespace[f"default_{index}"] = item.default
+            arguments.append(f"get({key!r}, default_{index})")
+    namespace["known"] = frozenset(known)
+
+    source = (
+        "def from_dict(obj):\n"
+        "    get = obj.get\n"
+        f"    return cls({', '.join(arguments)})\n"
+    )
+    exec(source, namespace)  # noqa: S102
+    return namespace["from_dict"]
+
+
+def _decodable(**renamed: str) -> Callable[[type[_ModelT]], type[_ModelT]]:
+    """Attach a generated ``from_dict`` decoder to a model."""
+
+    def decorate(cls: type[_ModelT]) -> type[_ModelT]:
+        cls.from_dict = staticmethod(_build_decoder(cls, renamed))  # type: ignore[attr-defined]
+        return cls
+
+    return decorate
+
+
+@_decodable()
+@dataclass(slots=True)
 class Configuration:
     """Configuration settings for the device."""
 
-    child_lock: int = field(default_factory=int)
-    auto_lock: int = field(default_factory=int)
-    volume_level: int = field(default_factory=int)
-    mode: int = field(default_factory=int)
-    manual: int = field(default_factory=int)
-    cat_sense: int = field(default_factory=int)
-    timezone: str = field(default_factory=str)
-    dst_from: str = field(default_factory=str)
-    dst_to: str = field(default_factory=str)
-    dnd_from: str = field(default_factory=str)
-    dnd_to: str = field(default_factory=str)
+    child_lock: int = 0
+    auto_lock: int = 0
+    volume_level: int = 0
+    mode: int = 0
+    manual: int = 0
+    cat_sense: int = 0
+    timezone: str = ""
+    dst_from: str = ""
+    dst_to: str = ""
+    dnd_from: str = ""
+    dnd_to: str = ""
     schedule: list[Any] = field(default_factory=list)
-    cat_delay: int = field(default_factory=int)
-    extra_dry: bool = field(default_factory=bool)
-    binary_elements: dict = field(default_factory=dict)
-
-    @staticmethod
-    def from_dict(obj: Any) -> Configuration:
-        """Parse data from API."""
-        return Configuration(
-            child_lock=obj.get("childLock", 0),
-            auto_lock=obj.get("autoLock", 0),
-            volume_level=obj.get("volumeLevel", 0),
-            mode=obj.get("mode", 0),
-            manual=obj.get("manual", 0),
-            cat_sense=obj.get("catSense", 0),
-            timezone=obj.get("timezone", ""),
-            dst_from=obj.get("dstFrom", ""),
-            dst_to=obj.get("dstTo", ""),
-            dnd_from=obj.get("dndFrom", ""),
-            dnd_to=obj.get("dndTo", ""),
-            schedule=obj.get("schedule", []),
-            cat_delay=obj.get("catDelay", 0),
-            extra_dry=obj.get("extraDry", False),
-            binary_elements=obj.get("binaryElements", {}),
-        )
+    cat_delay: int = 0
+    extra_dry: bool = False
+    binary_elements: dict[str, Any] = field(default_factory=dict)
+    extra: Mapping[str, Any] = field(default_factory=dict)
 
+    from_dict: ClassVar[Callable[[Mapping[str, Any]], Configuration]]
 
-@dataclass
+
+@_decodable()
+@dataclass(slots=True)
 class OperationStatus:
     """Operation status of the device."""
 
-    state: int = field(default_factory=int)
-    progress: int = field(default_factory=int)
-    error: str = field(default_factory=str)
+    state: int = 0
+    progress: int = 0
+    error: str = ""
     rtc: str | None = None
     sens: str | None = None
-    mode: int = field(default_factory=int)
-    manual: int = field(default_factory=int)
-    step_num: int = field(default_factory=int)
+    mode: int = 0
+    manual: int = 0
+    step_num: int = 0
     relay_mode: int | None = None
+    extra: Mapping[str, Any] = field(default_factory=dict)
 
-    @staticmethod
-    def from_dict(obj: Any) -> OperationStatus:
-        """Parse data from API."""
-        return OperationStatus(
-            state=obj.get("state", 0),
-            progress=obj.get("progress", 0),
-            error=obj.get("error", ""),
-            rtc=obj.get("rtc"),
-            sens=obj.get("sens"),
-            mode=obj.get("mode", 0),
-            manual=obj.get("manual", 0),
-            step_num=obj.get("stepNum", 0),
-            relay_mode=obj.get("relayMode"),
-        )
+    from_dict: ClassVar[Callable[[Mapping[str, Any]], OperationStatus]]
 
 
-@dataclass
+@_decodable(group_id="id")
+@dataclass(slots=True)
 class UpdateGroup:
     """Information about the update group."""
 
-    group_id: str = field(default_factory=str)
-    name: str = field(default_factory=str)
+    group_id: str = ""
+    name: str = ""
+    extra: Mapping[str, Any] = field(default_factory=dict)
 
-    @staticmethod
-    def from_dict(obj: Any) -> UpdateGroup:
-        """Parse data from API."""
-        return UpdateGroup(
-            group_id=obj.get("id", ""),
-            name=obj.get("name", ""),
-        )
+    from_dict: ClassVar[Callable[[Mapping[str, Any]], UpdateGroup]]
 
 
-@dataclass
+@_decodable(device_type="type")
+@dataclass(slots=True)
 class DeviceData:
-    """Comprehensive data representation for the device."""
+    """Comprehensive data representation for the device.
+
+    Fields the integration does not know yet, such as those added by new
+    firmware, are kept in ``extra``. Sections that polls rarely need are
+    decoded from ``raw`` only when they are first read.
+    """
 
-    manufacturer_id: str = field(default_factory=str)
+    manufacturer_id: str = ""
     name: str | None = None
     parent_id: str | None = None
     hw_revision: str | None = None
-    fw_version: str = field(default_factory=str)
-    device_type: int = field(default_factory=int)
-    status: int = field(default_factory=int)
-    reported_status: str = field(default_factory=str)
-    creation_time: str = field(default_factory=str)
+    fw_version: str = ""
+    device_type: int = 0
+    status: int = 0
+    reported_status: str = ""
+    creation_time: str = ""
     last_updated_time: str | None = None
-    custom_properties: list[Any] = field(default_factory=list)
     children_ids: list[Any] = field(default_factory=list)
-    is_online_timestamp: int = field(default_factory=int)
+    is_online_timestamp: int = 0
     mb_last_fw_status: str | None = None
     cp_last_fw_status: str | None = None
     lg_last_fw_status: str | None = None
-    pump_type_enum: str = field(default_factory=str)
-    configuration: Configuration = field(default_factory=Configuration)
+    pump_type_enum: str = ""
     operation_status: OperationStatus = field(default_factory=OperationStatus)
-    mac_address: str = field(default_factory=str)
+    mac_address: str = ""
     last_clean: str | None = None
-    total_sani_solution: int = field(default_factory=int)
-    used_sani_solution: int = field(default_factory=int)
-    remaining_sani_solution: int = field(default_factory=int)
-    tag_type: int = field(default_factory=int)
-    connection_mode: str = field(default_factory=str)
-    ble_connection_id: str = field(default_factory=str)
-    state: int = field(default_factory=int)
+    total_sani_solution: int = 0
+    used_sani_solution: int = 0
+    remaining_sani_solution: int = 0
+    tag_type: int = 0
+    connection_mode: str = ""
+    ble_connection_id: str = ""
+    state: int = 0
     selected_lang: str | None = None
     main_error_type: str | None = None
-    active_errors: list[Any] = field(default_factory=list)
-    update_group: UpdateGroup = field(default_factory=UpdateGroup)
-    service_level: str = field(default_factory=str)
+    service_level: str = ""
     activation_date_from_desired: str | None = None
     in_blacklist: bool | None = None
-    country_code: int = field(default_factory=int)
+    country_code: int = 0
     scale_id: str | None = None
-    low_heater: bool = field(default_factory=bool)
-    fan_shutter: bool = field(default_factory=bool)
+    low_heater: bool = False
+    fan_shutter: bool = False
     dome: str | None = None
     temp_out_ref_from_desired: str | None = None
-    online: bool = field(default_factory=bool)
-
-    @staticmethod
-    def from_dict(obj: Any) -> DeviceData:
-        """Parse data from API."""
-        return DeviceData(
-            manufacturer_id=obj.get("manufacturerId", ""),
-            name=obj.get("name"),
-            parent_id=obj.get("parentId"),
-            hw_revision=obj.get("hwRevision"),
-            fw_version=obj.get("fwVersion", ""),
-            device_type=obj.get("type", 0),
-            status=obj.get("status", 0),
-            reported_status=obj.get("reportedStatus", ""),
-            creation_time=obj.get("creationTime", ""),
-            last_updated_time=obj.get("lastUpdatedTime"),
-            custom_properties=obj.get("customProperties", []),
-            children_ids=obj.get("childrenIds", []),
-            is_online_timestamp=obj.get("isOnlineTimestamp", 0),
-            mb_last_fw_status=obj.get("mbLastFwStatus"),
-            cp_last_fw_status=obj.get("cpLastFwStatus"),
-            lg_last_fw_status=obj.get("lgLastFwStatus"),
-            pump_type_enum=obj.get("pumpTypeEnum", ""),
-            configuration=Configuration.from_dict(obj.get("configuration", {})),
-            operation_status=OperationStatus.from_dict(obj.get("operationStatus", {})),
-            mac_address=obj.get("macAddress", ""),
-            last_clean=obj.get("lastClean"),
-            total_sani_solution=obj.get("totalSaniSolution", 0),
-            used_sani_solution=obj.get("usedSaniSolution", 0),
-            remaining_sani_solution=obj.get("remainingSaniSolution", 0),
-            tag_type=obj.get("tagType", 0),
-            connection_mode=obj.get("connectionMode", ""),
-            ble_connection_id=obj.get("bleConnectionId", ""),
-            state=obj.get("state", 0),
-            selected_lang=obj.get("selectedLang"),
-            main_error_type=obj.get("mainErrorType"),
-            active_errors=obj.get("activeErrors", []),
-            update_group=UpdateGroup.from_dict(obj.get("updateGroup", {})),
-            service_level=obj.get("serviceLevel", ""),
-            activation_date_from_desired=obj.get("activationDateFromDesired"),
-            in_blacklist=obj.get("inBlacklist"),
-            country_code=obj.get("countryCode", 0),
-            scale_id=obj.get("scaleId"),
-            low_heater=obj.get("lowHeater", False),
-            fan_shutter=obj.get("fanShutter", False),
-            dome=obj.get("dome"),
-            temp_out_ref_from_desired=obj.get("tempOutRefFromDesired"),
-            online=obj.get("online", False),
-        )
+    online: bool = False
+    extra: Mapping[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=dict, repr=False, metadata=_RAW)
+
+    configuration: ClassVar[_LazySection[Configuration]] = _LazySection(
+        "configuration",
+        Configuration.from_dict,
+    )
+    update_group: ClassVar[_LazySection[UpdateGroup]] = _LazySection(
+        "updateGroup",
+        UpdateGroup.from_dict,
+    )
+    custom_properties: ClassVar[_LazySection[list[Any]]] = _LazySection(
+        "customProperties",
+        list,
+        (),
+    )
+    active_errors: ClassVar[_LazySection[list[Any]]] = _LazySection(
+        "activeErrors",
+        list,
+        (),
+    )
+    # _undecoded() returns a dataclasses.field, not a shared default value.
+    _configuration: Configuration = _undecoded()  # noqa: RUF009
+    _update_group: UpdateGroup = _undecoded()  # noqa: RUF009
+    _custom_properties: list[Any] = _undecoded()  # noqa: RUF009
+    _active_errors: list[Any] = _undecoded()  # noqa: RUF009
+
+    from_dict: ClassVar[Callable[[Mapping[str, Any]], DeviceData]]
+
+
+def changed_fields(before: Any, after: Any, prefix: str = "") -> set[str]:
+    """Return the dotted paths of the dataclass fields that differ.
+
+    Nested dataclasses such as ``operation_status`` are compared field by
+    field, so a change is reported as ``operation_status.state`` rather
+    than the whole section. Lazy sections are compared in the raw object
+    without decoding them.
+    """
+    changed: set[str] = set()
+    for item in fields(after):
+        if not item.compare:
+            continue
+        old = getattr(before, item.name)
+        new = getattr(after, item.name)
+        if old is new or old == new:
+            continue
+        if item.metadata.get("raw"):
+            changed.update(
+                f"{prefix}{name}"
+                for name, key in _lazy_sections(type(after)).items()
+                if old.get(key) != new.get(key)
+            )
+        elif is_dataclass(new) and type(old) is type(new):
+            changed |= changed_fields(old, new, f"{prefix}{item.name}.")
+        else:
+            changed.add(f"{prefix}{item.name}")
+    return changed
@@ -0,0 +1,33 @@
+"""Diagnostics support for the CatGenie integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_TOKEN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import CatGenieConfigEntry
+
+TO_REDACT = {CONF_TOKEN, "refreshToken", "macAddress", "bleConnectionId"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: CatGenieConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "client": client.as_dict(),
+        "coordinator": coordinator.as_dict(),
+        "devices": async_redact_data(coordinator.raw_devices, TO_REDACT),
+    }
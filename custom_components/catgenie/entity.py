@@ -3,11 +3,13 @@
 from enum import Enum
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import CatGenieCoordinator
+from .data import DeviceData
 
 
 class DeviceOperation(Enum):
@@ -24,16 +26,22 @@ class CatGenieEntity(CoordinatorEntity[CatGenieCoordinator]):
 
     _attr_has_entity_name = True
     _attr_suffix: str | None = None
+    # DeviceData field paths the entity reads, e.g. "operation_status.state".
+    # Updates to other fields are not dispatched to the entity.
+    _device_fields: tuple[str, ...] = ()
     coordinator: CatGenieCoordinator
 
     def __init__(
         self,
         coordinator: CatGenieCoordinator,
+        device_id: str,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(device_id, self._device_fields))
 
         self.coordinator = coordinator
+        self._device_id = device_id
+        self._last_written_state: tuple[Any, ...] | None = None
 
         # suffix = ""
         # if self.device_class is not None:  # type: ignore reportUnnecessaryComparison
@@ -46,9 +54,63 @@ class CatGenieEntity(CoordinatorEntity[CatGenieCoordinator]):
         #     self._attr_unique_id = uuid4().hex
         #     self.async_write_ha_state()
 
-        self._device_name = coordinator.data.name
+        self._device_name = self.device.name
         if not self._device_name:
-            self._device_name = f"Litter Box {coordinator.data.manufacturer_id}"
+            self._device_name = f"Litter Box {device_id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Populate the state from the data already held by the coordinator."""
+        await super().async_added_to_hass()
+        if self._device_id in self.coordinator.data:
+            self._update_from_device(self.device)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        Only devices the coordinator reports as changed are re-read, and the
+        state is only written when what Home Assistant would store differs.
+        """
+        if self._device_id in self.coordinator.changed:
+            self._update_from_device(self.device)
+        self._async_write_state_if_changed()
+
+    @callback
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state unless it matches the last written one."""
+        state = (self.available, self.state, self.extra_state_attributes)
+        if state == self._last_written_state:
+            self.coordinator.entity_writes_skipped += 1
+            return
+        self._last_written_state = state
+        self.coordinator.entity_writes += 1
+        self.async_write_ha_state()
+
+    @property
+    def device(self) -> DeviceData:
+        """Return the latest data for this entity's device."""
+        return self.coordinator.data[self._device_id]
+
+    @property
+    def available(self) -> bool:
+        """Return if the device is still reported by the API."""
+        return super().available and self._device_id in self.coordinator.data
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state served from the startup snapshot or during an outage."""
+        if not self.coordinator.stale:
+            return None
+        attributes: dict[str, Any] = {"stale": True}
+        if self.coordinator.last_successful_update is not None:
+            attributes["last_successful_update"] = (
+                self.coordinator.last_successful_update.isoformat()
+            )
+        return attributes
 
     @property
     def device_name(self) -> str:
@@ -58,7 +120,7 @@ class CatGenieEntity(CoordinatorEntity[CatGenieCoordinator]):
     @property
     def device_id(self) -> str:
         """Return the device ID."""
-        return self.coordinator.data.manufacturer_id
+        return self._device_id
 
     # @property
     # async def device(self) -> DeviceInfo:
@@ -85,15 +147,26 @@ class CatGenieEntity(CoordinatorEntity[CatGenieCoordinator]):
         return DeviceInfo(
             identifiers={
                 # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self.coordinator.data.manufacturer_id),
+                (DOMAIN, self._device_id),
             },
             # default_name="Litter Box",
+            name=self._device_name,
             manufacturer="PetNovations Ltd.",
             model="VXHCATGENIE",
-            model_id=self.coordinator.data.manufacturer_id,
-            sw_version=self.coordinator.data.fw_version,
+            model_id=self._device_id,
+            sw_version=self.device.fw_version,
         )
 
-    async def device_operation(self, device_id: str, op: DeviceOperation) -> Any:
-        """Obtain the list of devices associated to a user."""
-        return await self.coordinator.client.async_device_operation(device_id, op.value)
+    async def device_operation(
+        self,
+        device_id: str,
+        op: DeviceOperation,
+    ) -> DeviceOperation:
+        """Queue an operation and return the one sent to the device.
+
+        Operations sent in quick succession are collapsed, so the result
+        is the latest operation when ``op`` was superseded.
+        """
+        return DeviceOperation(
+            await self.coordinator.async_device_operation(device_id, op.value),
+        )
@@ -0,0 +1,112 @@
+"""Streaming latency tracking for the CatGenie cloud endpoints."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds, in seconds, of the histogram buckets. Latencies above the
+# last bound fall into an overflow bucket.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0,
+    20.0, 30.0, 60.0,
+)
+# Weight kept by older samples for every new one: the estimate follows
+# roughly the last 1 / (1 - LATENCY_DECAY) requests.
+LATENCY_DECAY = 0.98
+# Samples needed before the percentiles are trusted for timeouts.
+LATENCY_MIN_SAMPLES = 20
+# A request times out once it takes this many times the observed p95.
+TIMEOUT_P95_FACTOR = 3.0
+# Timeout, in seconds, until an endpoint has enough samples. Rare requests
+# such as the token refresh may never get there.
+TIMEOUT_COLD_START = 10.0
+
+_DEVICE_PATH = re.compile(r"^/device/management/[^/]+/")
+_RESCALE_WEIGHT = 1e100
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Return the endpoint of a request, with the device id left out."""
+    return f"{method} {_DEVICE_PATH.sub('/device/management/{device_id}/', url)}"
+
+
+class LatencyHistogram:
+    """Exponentially decayed latency histogram of one endpoint.
+
+    Newer samples get a growing weight instead of decaying every bucket on
+    each sample, so recording is O(log buckets). Percentiles interpolate
+    within a bucket. Undecayed counts are kept alongside for reporting.
+    """
+
+    def __init__(self, decay: float = LATENCY_DECAY) -> None:
+        """Initialize an empty histogram."""
+        self._growth = 1 / decay
+        self._weight = 1.0
+        self._weights = [0.0] * (len(LATENCY_BUCKETS) + 1)
+        self._total = 0.0
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples = 0
+        self.timeouts = 0
+
+    def record(self, seconds: float, *, timed_out: bool = False) -> None:
+        """Add a latency sample.
+
+        A timed out request is recorded at its timeout, so a slowing cloud
+        pushes the percentiles, and the next timeout, up.
+        """
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        self.counts[index] += 1
+        self.samples += 1
+        if timed_out:
+            self.timeouts += 1
+
+        self._weight *= self._growth
+        if self._weight > _RESCALE_WEIGHT:
+            self._weights = [weight / self._weight for weight in self._weights]
+            self._total /= self._weight
+            self._weight = 1.0
+        self._weights[index] += self._weight
+        self._total += self._weight
+
+    def quantile(self, fraction: float) -> float | None:
+        """Return the decayed ``fraction`` quantile, or None without samples."""
+        if not self.samples:
+            return None
+        target = fraction * self._total
+        cumulative = 0.0
+        for index, weight in enumerate(self._weights):
+            if weight and cumulative + weight >= target:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = (
+                    LATENCY_BUCKETS[index]
+                    if index < len(LATENCY_BUCKETS)
+                    else 2 * LATENCY_BUCKETS[-1]
+                )
+                return lower + (upper - lower) * (target - cumulative) / weight
+            cumulative += weight
+        return LATENCY_BUCKETS[-1]
+
+    def timeout(self, floor: float, ceiling: float) -> float:
+        """Return the timeout for the next request to the endpoint."""
+        p95 = self.quantile(0.95)
+        if p95 is None or self.samples < LATENCY_MIN_SAMPLES:
+            timeout = TIMEOUT_COLD_START
+        else:
+            timeout = p95 * TIMEOUT_P95_FACTOR
+        return min(ceiling, max(floor, timeout))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts and percentiles for diagnostics."""
+        return {
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": {
+                f"le_{bound:g}": count
+                for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False)
+            }
+            | {"overflow": self.counts[-1]},
+        }
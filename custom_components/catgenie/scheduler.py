@@ -0,0 +1,111 @@
+"""Domain-level request scheduling shared by every CatGenie account."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import DOMAIN, REQUEST_BUDGET_BURST, REQUEST_BUDGET_RATE
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+
+class RequestBudget:
+    """Token bucket limiting the request rate to the cloud.
+
+    Tokens are added at ``rate`` per second up to ``burst``; every request
+    takes one. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class CatGenieScheduler:
+    """Staggers the polls of every account and holds the request budget.
+
+    Each registered coordinator gets a phase, spread evenly over ``[0, 1)``.
+    Its next poll is moved to the nearest point of its interval that matches
+    the phase, so accounts with the same interval poll one after another
+    instead of at once.
+    """
+
+    def __init__(self, budget: RequestBudget) -> None:
+        """Initialize."""
+        self.budget = budget
+        self._members: list[object] = []
+        self._phases: dict[object, float] = {}
+
+    @callback
+    def async_register(self, member: object) -> CALLBACK_TYPE:
+        """Add an account to the schedule and return its removal callback."""
+        self._members.append(member)
+        self._spread()
+
+        @callback
+        def _remove() -> None:
+            self._members.remove(member)
+            self._spread()
+
+        return _remove
+
+    def _spread(self) -> None:
+        """Assign evenly spaced phases to the registered accounts."""
+        count = len(self._members)
+        self._phases = {
+            member: index / count for index, member in enumerate(self._members)
+        }
+
+    def align(self, member: object, interval: timedelta) -> timedelta:
+        """Return the delay until the next poll slot of an account.
+
+        The delay stays within half an interval of ``interval``, so the
+        polling rate is unchanged while the phase is kept.
+        """
+        phase = self._phases.get(member)
+        period = interval.total_seconds()
+        if phase is None or period <= 0 or len(self._members) < 2:
+            return interval
+        offset = phase * period
+        now = time.monotonic()
+        slot = round((now + period - offset) / period) * period + offset
+        return timedelta(seconds=slot - now)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> CatGenieScheduler:
+    """Return the scheduler shared by every config entry."""
+    scheduler: CatGenieScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = CatGenieScheduler(
+            RequestBudget(REQUEST_BUDGET_RATE, REQUEST_BUDGET_BURST),
+        )
+        hass.data[DATA_SCHEDULER] = scheduler
+    return scheduler
@@ -1,39 +1,137 @@
 """Platform for sensor integration."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LOGGER
+from .coordinator import CatGenieCoordinator
 from .entity import CatGenieEntity
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .api import CatGenieApiClient
+    from .data import CatGenieConfigEntry, DeviceData
+
+
+@dataclass(frozen=True, kw_only=True)
+class CatGenieDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes an account-level performance sensor."""
+
+    value_fn: Callable[[CatGenieApiClient, CatGenieCoordinator], float | int | None]
+
+
+def _slowest_p95(client: CatGenieApiClient) -> float | None:
+    """Return the highest p95 latency of the endpoints, in milliseconds."""
+    p95 = [
+        value
+        for histogram in client.latency.values()
+        if (value := histogram.quantile(0.95)) is not None
+    ]
+    return round(max(p95) * 1000, 1) if p95 else None
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Return a duration in seconds as rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+DIAGNOSTIC_SENSORS: tuple[CatGenieDiagnosticSensorEntityDescription, ...] = (
+    CatGenieDiagnosticSensorEntityDescription(
+        key="requests",
+        name="API requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client, _: client.request_counts.total(),
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="request_latency_p95",
+        name="API latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client, _: _slowest_p95(client),
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="token_refreshes",
+        name="Token refreshes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client, _: client.token_refreshes,
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="update_duration",
+        name="Update duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _, coordinator: _milliseconds(
+            coordinator.last_update_duration,
+        ),
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="failure_streak",
+        name="Failed updates",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _, coordinator: coordinator.failure_streak,
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="parse_time",
+        name="Parse time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _, coordinator: _milliseconds(coordinator.last_parse_time),
+    ),
+    CatGenieDiagnosticSensorEntityDescription(
+        key="entity_writes",
+        name="State writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _, coordinator: coordinator.entity_writes,
+    ),
+)
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # Unused function argument: `hass`
-    entry: ConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: CatGenieConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
     LOGGER.info(f"Setting up binary_sensor platform: {entry.entry_id}")
-    coordinator = hass.data[DOMAIN]["coordinator"]
+    coordinator = entry.runtime_data.coordinator
 
     async_add_entities(
-        {
-            CatGenieSaniSolutionSensor(coordinator=coordinator),
-        },
+        CatGenieSaniSolutionSensor(coordinator=coordinator, device_id=device_id)
+        for device_id in coordinator.data
+    )
+    async_add_entities(
+        CatGenieDiagnosticSensor(entry, description)
+        for description in DIAGNOSTIC_SENSORS
     )
 
 class CatGenieSaniSolutionSensor(CatGenieEntity, SensorEntity):
     """Representation of a CatGenie Cloud sensor entity."""
 
+    _device_fields = ("remaining_sani_solution",)
+
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_sani_solution"
+        return f"{self._device_id}_sani_solution"
 
     @property
     def name(self) -> str:
@@ -41,9 +139,42 @@ class CatGenieSaniSolutionSensor(CatGenieEntity, SensorEntity):
         return "Solution"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if not self.coordinator.data:
-            return
-        self._attr_native_value = self.coordinator.data.remaining_sani_solution
-        self.async_write_ha_state()
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_native_value = device.remaining_sani_solution
+
+
+class CatGenieDiagnosticSensor(CoordinatorEntity[CatGenieCoordinator], SensorEntity):
+    """Performance statistics of an account, disabled by default."""
+
+    entity_description: CatGenieDiagnosticSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        entry: CatGenieConfigEntry,
+        description: CatGenieDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry.runtime_data.coordinator)
+        self.entity_description = description
+        self._client = entry.runtime_data.client
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="PetNovations Ltd.",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, the statistics matter most while updates fail."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current value of the statistic."""
+        return self.entity_description.value_fn(self._client, self.coordinator)
@@ -0,0 +1,121 @@
+"""Services for the CatGenie integration."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .api import CatGenieApiClientError
+from .const import BULK_OPERATION_CONCURRENCY, DOMAIN, LOGGER
+from .entity import DeviceOperation
+
+if TYPE_CHECKING:
+    from .coordinator import CatGenieCoordinator
+
+SERVICE_BULK_OPERATION = "bulk_operation"
+ATTR_OPERATION = "operation"
+
+BULK_OPERATION_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_OPERATION): vol.In(
+            [operation.name.lower() for operation in DeviceOperation],
+        ),
+    },
+)
+
+
+def _resolve_device(
+    hass: HomeAssistant,
+    device_id: str,
+) -> tuple[CatGenieCoordinator, str] | None:
+    """Return the coordinator and CatGenie id of a registry device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    serial = next(
+        (value for domain, value in device.identifiers if domain == DOMAIN),
+        None,
+    )
+    if serial is None:
+        return None
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is not None
+            and entry.domain == DOMAIN
+            and entry.state is ConfigEntryState.LOADED
+        ):
+            coordinator: CatGenieCoordinator = entry.runtime_data.coordinator
+            # The account device of the diagnostic sensors is not a box.
+            if serial not in coordinator.data:
+                return None
+            return coordinator, serial
+    return None
+
+
+async def _async_bulk_operation(
+    hass: HomeAssistant,
+    call: ServiceCall,
+) -> ServiceResponse:
+    """Send one operation to many boxes at once.
+
+    Commands run concurrently, at most ``BULK_OPERATION_CONCURRENCY`` at a
+    time, and the outcome is reported per device.
+    """
+    operation = DeviceOperation[call.data[ATTR_OPERATION].upper()]
+    semaphore = asyncio.Semaphore(BULK_OPERATION_CONCURRENCY)
+    refresh: set[CatGenieCoordinator] = set()
+
+    async def _async_operate(device_id: str) -> dict[str, Any]:
+        if (target := _resolve_device(hass, device_id)) is None:
+            return {"success": False, "error": "Unknown CatGenie device"}
+        coordinator, serial = target
+        async with semaphore:
+            try:
+                sent = await coordinator.async_device_operation(
+                    serial,
+                    operation.value,
+                )
+            except CatGenieApiClientError as exception:
+                LOGGER.warning("%s on %s failed: %s", operation.name, serial, exception)
+                return {"success": False, "error": str(exception)}
+        refresh.add(coordinator)
+        return {"success": True, "operation": DeviceOperation(sent).name.lower()}
+
+    device_ids: list[str] = list(dict.fromkeys(call.data[ATTR_DEVICE_ID]))
+    outcomes = await asyncio.gather(
+        *(_async_operate(device_id) for device_id in device_ids),
+    )
+    for coordinator in refresh:
+        await coordinator.async_request_refresh()
+
+    if not call.return_response:
+        return None
+    return {"devices": dict(zip(device_ids, outcomes, strict=True))}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_OPERATION,
+        partial(_async_bulk_operation, hass),
+        schema=BULK_OPERATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
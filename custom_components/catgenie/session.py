@@ -0,0 +1,80 @@
+"""Shared HTTP session for the CatGenie cloud."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, callback
+from homeassistant.util.ssl import get_default_context
+
+from .api import CircuitBreaker
+from .const import (
+    DOMAIN,
+    HOST,
+    SESSION_CONNECTION_LIMIT,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_SESSION = f"{DOMAIN}_session"
+DATA_CIRCUIT_BREAKERS = f"{DOMAIN}_breakers"
+
+# Accept-Encoding is left to aiohttp, which only offers the encodings it
+# can decode: gzip and deflate, plus br when a brotli module is installed.
+HEADERS = {
+    hdrs.HOST: HOST,
+    hdrs.USER_AGENT: "CatGenie/493 CFNetwork/1559 Darwin/24.0.0",
+    hdrs.CONNECTION: "keep-alive",
+    hdrs.ACCEPT: "application/json, text/plain, */*",
+    hdrs.ACCEPT_LANGUAGE: "en-US,en;q=0.9",
+}
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by every config entry and the config flow.
+
+    The session owns a dedicated connection pool for the cloud host and is
+    closed when Home Assistant shuts down.
+    """
+    session: aiohttp.ClientSession | None = hass.data.get(DATA_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    session = aiohttp.ClientSession(
+        base_url=f"https://{HOST}",
+        headers=HEADERS,
+        connector=aiohttp.TCPConnector(
+            limit=SESSION_CONNECTION_LIMIT,
+            limit_per_host=SESSION_CONNECTION_LIMIT,
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+            ssl=get_default_context(),
+        ),
+    )
+    hass.data[DATA_SESSION] = session
+
+    async def _async_close(_: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
+
+
+@callback
+def async_get_circuit_breaker(hass: HomeAssistant, host: str = HOST) -> CircuitBreaker:
+    """Return the circuit breaker shared by every client of ``host``."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(
+        DATA_CIRCUIT_BREAKERS,
+        {},
+    )
+    if host not in breakers:
+        breakers[host] = CircuitBreaker(host)
+    return breakers[host]
@@ -0,0 +1,97 @@
+"""Persistent storage for CatGenie config entries."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION, TOKEN_SAVE_DELAY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class CatGenieTokenStore:
+    """Keep the access token of a config entry across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.token",
+            private=True,
+            atomic_writes=True,
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> tuple[str, datetime] | None:
+        """Return the stored access token and expiration, if still valid."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+        expiration = datetime.fromtimestamp(data["expiration"], timezone.utc)
+        if expiration <= datetime.now(timezone.utc):
+            return None
+        return data["access_token"], expiration
+
+    @callback
+    def async_save(self, access_token: str, expiration: datetime) -> None:
+        """Schedule a debounced write of a new access token."""
+        self._data = {
+            "access_token": access_token,
+            "expiration": expiration.timestamp(),
+        }
+        self._store.async_delay_save(lambda: self._data, TOKEN_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored token."""
+        await self._store.async_remove()
+
+
+def _compact(obj: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty values, which the parsers fill back in with defaults."""
+    return {
+        key: value
+        for key, value in obj.items()
+        if value is not None and value not in ("", [], {})
+    }
+
+
+class CatGenieSnapshotStore:
+    """Keep the last good device list of a config entry across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[list[dict[str, Any]]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.snapshot",
+            atomic_writes=True,
+        )
+        self._devices: list[dict[str, Any]] = []
+
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Return the raw device objects of the last snapshot."""
+        return await self._store.async_load() or []
+
+    @callback
+    def async_save(self, devices: list[dict[str, Any]]) -> None:
+        """Schedule a debounced write of the raw device objects.
+
+        The objects are only compacted when the write happens, so updates
+        superseded within the save delay cost nothing.
+        """
+        self._devices = devices
+        self._store.async_delay_save(self._compacted, SNAPSHOT_SAVE_DELAY)
+
+    def _compacted(self) -> list[dict[str, Any]]:
+        """Return the latest raw device objects to write."""
+        return [_compact(obj) for obj in self._devices]
+
+    async def async_remove(self) -> None:
+        """Remove the stored snapshot."""
+        await self._store.async_remove()
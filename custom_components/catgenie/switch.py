@@ -6,27 +6,26 @@ from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .data import CatGenieConfigEntry, DeviceData
 from .entity import CatGenieEntity, DeviceOperation
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
-    _: ConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: CatGenieConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SwitchBot Cloud entry."""
-    coordinator = hass.data[DOMAIN]["coordinator"]
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        {
-            CatGenieSwitch(
-                coordinator=coordinator,
-            ),
-        },
+        CatGenieSwitch(
+            coordinator=coordinator,
+            device_id=device_id,
+        )
+        for device_id in coordinator.data
     )
 
 
@@ -34,11 +33,12 @@ class CatGenieSwitch(CatGenieEntity, SwitchEntity):
     """Representation of a SwitchBot switch."""
 
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _device_fields = ("operation_status.state",)
 
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
-        return f"{self.coordinator.data.manufacturer_id}_clean"
+        return f"{self._device_id}_clean"
 
     @property
     def name(self) -> str:
@@ -57,26 +57,44 @@ class CatGenieSwitch(CatGenieEntity, SwitchEntity):
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn the device on."""
-        await self.device_operation(self._device_id, DeviceOperation.ON)
-        self._attr_is_on = True
+        await self._async_operate(DeviceOperation.ON)
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn the device off."""
-        await self.device_operation(self._device_id, DeviceOperation.OFF)
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        await self._async_operate(DeviceOperation.OFF)
+
+    async def _async_operate(self, op: DeviceOperation) -> None:
+        """Send an operation and confirm the one the device received.
+
+        The confirmation burst runs in the background, tied to the config
+        entry, so the service call returns once the command was sent.
+        """
+        sent = await self.device_operation(self._device_id, op)
+        is_on = sent is not DeviceOperation.OFF
+        self._attr_is_on = is_on
+        self._async_write_state_if_changed()
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_confirm(is_on),
+            f"{self.entity_id} confirm {op.name.lower()}",
+        )
 
-    @property
-    def _device_id(self) -> str:
-        """Return the device ID."""
-        return self.coordinator.data.manufacturer_id
+    async def _async_confirm(self, is_on: bool) -> None:
+        """Fall back to the reported state when a command is not confirmed.
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if not self.coordinator.data:
+        An unconfirmed command leaves the cached device unchanged, so no
+        coordinator update would undo the optimistic state.
+        """
+        if await self.coordinator.async_confirm_operation(
+            self._device_id,
+            lambda status: (status.state > 0) == is_on,
+        ):
             return
-        self._attr_is_on = (
-            self.coordinator.data.operation_status.state == DeviceOperation.ON
-        )
-        self.async_write_ha_state()
+        if self._device_id in self.coordinator.data:
+            self._update_from_device(self.device)
+        self._async_write_state_if_changed()
+
+    @callback
+    def _update_from_device(self, device: DeviceData) -> None:
+        """Update the entity attributes from the device data."""
+        self._attr_is_on = device.operation_status.state > 0
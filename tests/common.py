@@ -0,0 +1,29 @@
+"""Helpers shared by the CatGenie tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+
+
+class StubResponse:
+    """Minimal ``aiohttp.ClientResponse`` replacement."""
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        """Raise for error status codes."""
+        if self.status >= 400:
+            raise aiohttp.ClientError(self.status)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def json(self) -> Any:
+        """Return the decoded body."""
+        raise NotImplementedError
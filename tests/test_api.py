@@ -0,0 +1,120 @@
+"""Tests for the CatGenie API client."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from custom_components.catgenie.api import (
+    CatGenieApiClient,
+    CatGenieApiClientAuthenticationError,
+    CatGenieApiClientCircuitOpenError,
+    CatGenieApiClientCommunicationError,
+    CircuitBreaker,
+)
+
+from .common import StubResponse
+
+
+class HangingSession:
+    """Session whose requests never complete."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    async def request(self, **_: Any) -> Any:
+        self.started.set()
+        await asyncio.Event().wait()
+
+
+class RejectingSession:
+    """Session rejecting the access token, refreshing with ``refresh``."""
+
+    def __init__(self, refresh: Any) -> None:
+        self.refresh = refresh
+
+    async def request(self, **_: Any) -> StubResponse:
+        return StubResponse(b"", status=401)
+
+    async def post(self, **_: Any) -> StubResponse:
+        return await self.refresh()
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def _client(session: Any, breaker: CircuitBreaker) -> CatGenieApiClient:
+    client = CatGenieApiClient("refresh", session, circuit_breaker=breaker)
+    client.set_access_token("access", datetime.now(timezone.utc) + timedelta(hours=1))
+    return client
+
+
+async def test_cancelled_trial_releases_breaker() -> None:
+    """A cancelled half-open trial lets the next request through."""
+    breaker = _open_breaker()
+    session = HangingSession()
+    client = _client(session, breaker)
+    task = asyncio.create_task(client.async_device_operation("CG0", 1))
+    await session.started.wait()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CatGenieApiClientCircuitOpenError):
+        breaker.before_request()
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_request() is True
+
+
+async def test_cancelled_request_keeps_trial() -> None:
+    """Only the trial itself releases the trial of a half-open breaker."""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0)
+    session = HangingSession()
+    client = _client(session, breaker)
+    task = asyncio.create_task(client.async_device_operation("CG0", 1))
+    await session.started.wait()
+    breaker.record_failure()
+    assert breaker.before_request() is True
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(CatGenieApiClientCircuitOpenError):
+        breaker.before_request()
+
+
+async def test_rejected_refresh_token_fails_authentication() -> None:
+    """A refresh rejected after a 401 raises an authentication error."""
+
+    async def refresh() -> StubResponse:
+        return StubResponse(b"", status=401)
+
+    client = _client(RejectingSession(refresh), CircuitBreaker("test"))
+    with pytest.raises(CatGenieApiClientAuthenticationError):
+        await client.async_get_device_status("CG0")
+
+
+async def test_refresh_timeout_after_401_is_a_communication_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A refresh timing out after a 401 is retried as a communication error."""
+    monkeypatch.setattr("custom_components.catgenie.api.RETRY_BACKOFF", 0.0)
+
+    async def refresh() -> StubResponse:
+        raise TimeoutError
+
+    breaker = CircuitBreaker("test")
+    client = _client(RejectingSession(refresh), breaker)
+    with pytest.raises(CatGenieApiClientCommunicationError):
+        await client.async_get_device_status("CG0")
+    assert breaker.failures == 3
@@ -0,0 +1,48 @@
+"""Tests for the per-device command queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.catgenie.commands import DeviceCommandQueue
+
+
+async def test_cancel_before_worker_started() -> None:
+    """Cancelling right after a submit cancels the caller and resets the queue."""
+    sent: list[int] = []
+
+    async def send(_: str, state: int) -> None:
+        sent.append(state)
+
+    queue = DeviceCommandQueue("CG0", send, 0)
+    future = queue.submit(4)
+    queue.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+    assert await queue.submit(1) == 1
+    assert sent == [1]
+
+
+async def test_cancel_does_not_reset_the_next_worker() -> None:
+    """The cancelled worker leaves a queue restarted by a new submit alone."""
+    release = asyncio.Event()
+    sent: list[int] = []
+
+    async def send(_: str, state: int) -> None:
+        sent.append(state)
+        await release.wait()
+
+    queue = DeviceCommandQueue("CG0", send, 0)
+    first = queue.submit(1)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    queue.cancel()
+    second = queue.submit(2)
+    release.set()
+
+    assert await second == 2
+    assert first.cancelled()
+    assert sent == [1, 2]
@@ -0,0 +1,28 @@
+"""Tests for the endpoint latency tracking."""
+
+from __future__ import annotations
+
+from custom_components.catgenie.latency import (
+    LATENCY_MIN_SAMPLES,
+    TIMEOUT_COLD_START,
+    LatencyHistogram,
+)
+
+
+def test_cold_start_timeout() -> None:
+    """Endpoints without enough samples use the cold start timeout."""
+    histogram = LatencyHistogram()
+    assert histogram.timeout(2, 20) == TIMEOUT_COLD_START
+    for _ in range(LATENCY_MIN_SAMPLES - 1):
+        histogram.record(0.2)
+    assert histogram.timeout(2, 20) == TIMEOUT_COLD_START
+    assert histogram.timeout(2, 5) == 5
+
+
+def test_timeout_follows_p95() -> None:
+    """With enough samples the timeout follows the observed p95."""
+    histogram = LatencyHistogram()
+    for _ in range(LATENCY_MIN_SAMPLES):
+        histogram.record(0.2)
+    assert histogram.timeout(0.1, 20) < TIMEOUT_COLD_START
+    assert histogram.timeout(2, 20) == 2